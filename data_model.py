@@ -193,7 +193,8 @@ class CsvTableModel(QAbstractTableModel):
                     return self._theme.INFO_QCOLOR
                 if index == self._current_search_index: return QColor(self._theme.DANGER)
                 elif index in self._search_highlight_indexes: return QColor(self._theme.WARNING).lighter(150)
-                return self._theme.BG_LEVEL_0_QCOLOR if row % 2 == 0 else self._theme.BG_LEVEL_1_QCOLOR
+                # 縞模様はビューの交互行カラー（alternate-background-color）で描画する
+                return None
                 
             if role == Qt.ForegroundRole and index == self._current_search_index: return QColor("white")
         
@@ -14,24 +14,35 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QObject, Signal, QTimer, QEvent
 
 
-class TooltipEventFilter(QObject):
+def resolve_tooltip_text(text_callback):
+    """ツールチップ用の文字列か生成関数から表示テキストを得る"""
+    return text_callback() if callable(text_callback) else text_callback
+
+
+class SharedTooltipFilter(QObject):
     """
-    ターゲットウィジェットのツールチップ表示直前に内容を更新するイベントフィルター。
-    これにより、ツールチップのテキストを動的に変更できる。
+    複数ウィジェットのツールチップを1つのイベントフィルターで動的に更新する。
+    ツールチップ表示直前に、登録した生成関数（または固定文字列）の内容を反映する。
     """
-    def __init__(self, target_widget, text_callback):
-        super().__init__(target_widget)
-        self.target_widget = target_widget
-        self.text_callback = text_callback
-        self.original_tooltip = target_widget.toolTip()
-        self.target_widget.setToolTip(self.text_callback())
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.callbacks = {}
+
+    def register(self, widget, text_callback):
+        """ウィジェットとツールチップ（生成関数または固定文字列）を登録し、フィルターをインストールする"""
+        self.callbacks[widget] = text_callback
+        widget.setToolTip(resolve_tooltip_text(text_callback))
+        widget.installEventFilter(self)
 
     def eventFilter(self, obj, event):
-        if obj == self.target_widget and event.type() == QEvent.ToolTip:
-            new_tooltip_text = self.text_callback()
-            if self.target_widget.toolTip() != new_tooltip_text:
-                self.target_widget.setToolTip(new_tooltip_text)
-        return super().eventFilter(obj, event)
+        if event.type() != QEvent.ToolTip:
+            return False
+        text_callback = self.callbacks.get(obj)
+        if text_callback is not None:
+            new_tooltip_text = resolve_tooltip_text(text_callback)
+            if obj.toolTip() != new_tooltip_text:
+                obj.setToolTip(new_tooltip_text)
+        return False
 
 
 class EncodingSaveDialog(QDialog):
@@ -4,7 +4,7 @@ import csv
 import pandas as pd
 import os
 import traceback
-from PySide6.QtCore import QObject, Signal, QRunnable, Slot, QCoreApplication, QThread, QTimer
+from PySide6.QtCore import QObject, Signal, QRunnable, Slot, QCoreApplication, QThread, QTimer, Qt
 from PySide6.QtWidgets import QApplication
 from concurrent.futures import ThreadPoolExecutor
 import time
@@ -12,6 +12,11 @@ import re
 import math
 from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP, ROUND_UP
 
+# 検索中にキャンセルを確認する間隔（行数）
+SEARCH_CANCEL_CHECK_ROWS = 10000
+
+# 色だけが変わる dataChanged のロール（検索ハイライト・パルス表示）。セルの値は変わらない
+_COLOR_ONLY_ROLES = {int(Qt.BackgroundRole), int(Qt.ForegroundRole)}
 
 #==============================================================================
 # 1. 非同期処理管理クラス
@@ -83,7 +88,42 @@ class AsyncDataManager(QObject):
         self.timeout_timer = QTimer()
         self.timeout_timer.setSingleShot(True)
         self.timeout_timer.timeout.connect(self._handle_timeout)
+
+        # 検索用の空セル除外キャッシュ（列番号 → 空でない行番号リスト）。データ変更で破棄する
+        self._blank_cache = {}
+        self._blank_cache_df = None
+        table_model = getattr(self.app, 'table_model', None)
+        if table_model is not None:
+            table_model.dataChanged.connect(self._on_model_data_changed)
+            for signal in (table_model.modelReset, table_model.layoutChanged,
+                           table_model.rowsInserted, table_model.rowsRemoved,
+                           table_model.columnsInserted, table_model.columnsRemoved):
+                signal.connect(self.invalidate_blank_cache)
         
+    def _on_model_data_changed(self, top_left, bottom_right, roles=()):
+        """セルの値が変わったときだけキャッシュを破棄する（検索ハイライトなどの色の変更は無視）"""
+        if roles and {int(role) for role in roles} <= _COLOR_ONLY_ROLES:
+            return
+        self.invalidate_blank_cache()
+
+    def invalidate_blank_cache(self, *args):
+        """空セル除外キャッシュを破棄する"""
+        # 検索スレッドが古い辞書を使用中でも影響しないよう、中身を消さずに新しい辞書に差し替える
+        self._blank_cache = {}
+
+    def _non_blank_rows(self, df, col_idx, column_values):
+        """列内の空でないセルの行番号を返す（データが変わるまで再利用）"""
+        if df is not self._blank_cache_df:
+            self._blank_cache = {}
+            self._blank_cache_df = df
+        # 検索中に破棄されても、この検索では取得時点の辞書を使い続ける
+        cache = self._blank_cache
+        rows = cache.get(col_idx)
+        if rows is None:
+            rows = [i for i, value in enumerate(column_values) if value is not None and value != ""]
+            cache[col_idx] = rows
+        return rows
+
     def cancel_current_task(self):
         """現在の非同期タスクにキャンセルを要求する（スレッドセーフ版）"""
         self.is_cancelled = True
@@ -329,10 +369,7 @@ class AsyncDataManager(QObject):
                     self.task_progress.emit("検索完了", 1, 1)
                     return
 
-                pattern = re.compile(
-                    search_term if is_regex else re.escape(search_term),
-                    0 if is_case_sensitive else re.IGNORECASE
-                )
+                matches = self._build_cell_matcher(search_term, is_case_sensitive, is_regex)
                 
                 target_rows = list(range(df.shape[0]))
                 
@@ -340,31 +377,43 @@ class AsyncDataManager(QObject):
                     selected_row_indices = {idx.row() for idx in self.app.table_view.selectionModel().selectedIndexes()}
                     target_rows = sorted(list(selected_row_indices.intersection(target_rows)))
                 
-                headers = self.app.table_model._headers
-                target_col_indices = {headers.index(name) for name in target_columns if name in headers}
+                # 列名→列番号の対応を一度だけ作り、対象列だけを走査する
+                header_positions = {name: i for i, name in enumerate(self.app.table_model._headers)}
+                target_col_indices = sorted({header_positions[name] for name in target_columns if name in header_positions})
                 
                 total_search_cells = len(target_rows) * len(target_col_indices)
                 processed_cells = 0
                 
-                for row_idx in target_rows:
+                # 空文字に一致しない検索なら、空セルは走査から外せる
+                skip_blanks = not in_selection_only and not matches("")
+                
+                # 列単位で値配列を取り出して走査（セルごとの df.iat 呼び出しを避ける）
+                for col_idx in target_col_indices:
                     if self.is_cancelled:
                         self.task_progress.emit("検索がキャンセルされました", 1, 1)
                         self.search_results_ready.emit([])
                         return
                     
-                    for col_idx in target_col_indices:
-                        if col_idx < len(df.columns):
-                            cell_value = df.iat[row_idx, col_idx]
-                            if cell_value is not None and pattern.search(str(cell_value)):
-                                results.append((row_idx, col_idx)) 
-                        
-                        processed_cells += 1
-                        if processed_cells % 1000 == 0:
-                            self.task_progress.emit(
-                                "データ内を検索中...", 
-                                processed_cells, 
-                                total_search_cells
-                            )
+                    if col_idx < len(df.columns):
+                        column_values = df.iloc[:, col_idx].to_numpy()
+                        scan_rows = self._non_blank_rows(df, col_idx, column_values) if skip_blanks else target_rows
+                        # 行数の多い列でもすぐに止められるよう、一定行数ごとにキャンセルを確認する
+                        for chunk_start in range(0, len(scan_rows), SEARCH_CANCEL_CHECK_ROWS):
+                            if self.is_cancelled:
+                                self.task_progress.emit("検索がキャンセルされました", 1, 1)
+                                self.search_results_ready.emit([])
+                                return
+                            for row_idx in scan_rows[chunk_start:chunk_start + SEARCH_CANCEL_CHECK_ROWS]:
+                                cell_value = column_values[row_idx]
+                                if cell_value is not None and matches(str(cell_value)):
+                                    results.append((row_idx, col_idx))
+                    
+                    processed_cells += len(target_rows)
+                    self.task_progress.emit(
+                        "データ内を検索中...", 
+                        processed_cells, 
+                        total_search_cells
+                    )
             
             self.task_progress.emit("検索完了", 1, 1)
             
@@ -382,6 +431,24 @@ class AsyncDataManager(QObject):
         
         self.search_results_ready.emit(results) 
 
+    @staticmethod
+    def _build_cell_matcher(search_term, is_case_sensitive, is_regex):
+        """セル文字列の一致判定関数を返す。リテラル検索は（大文字小文字を区別しない場合はASCIIのセルのみ）正規表現エンジンを経由しない"""
+        if not is_regex and is_case_sensitive:
+            return lambda text: search_term in text
+        
+        pattern = re.compile(
+            search_term if is_regex else re.escape(search_term),
+            0 if is_case_sensitive else re.IGNORECASE
+        )
+        if not is_regex and search_term.isascii():
+            # lower() と re.IGNORECASE は非ASCII文字（ı, ſ など）の扱いが異なるため、
+            # ASCIIのセルだけを lower() で判定し、それ以外は正規表現で判定して結果を揃える
+            needle = search_term.lower()
+            search = pattern.search
+            return lambda text: needle in text.lower() if text.isascii() else search(text)
+        return pattern.search
+
     def analyze_parent_child_async(self, db_backend_instance, column_name, mode):
         self.is_cancelled = False
         worker = Worker(self._do_analyze_parent_child_in_db, db_backend_instance, column_name, mode)
@@ -1142,6 +1209,7 @@ class ParentChildManager(QObject):
         self.current_group_column = None
         self.df = None
         self.db_backend = None
+        self._allowed_indices_cache = {}
 
     def analyze_relationships(self, dataframe, column_name, mode='consecutive'):
         """親子関係分析のディスパッチャー（メモリ内）"""
@@ -1167,6 +1235,7 @@ class ParentChildManager(QObject):
         self.df = dataframe
         self.current_group_column = column_name
         self.parent_child_data.clear()
+        self._allowed_indices_cache.clear()
 
         is_new_group = self.df[column_name] != self.df[column_name].shift()
         group_ids = is_new_group.cumsum()
@@ -1194,6 +1263,7 @@ class ParentChildManager(QObject):
         self.df = dataframe
         self.current_group_column = column_name
         self.parent_child_data.clear()
+        self._allowed_indices_cache.clear()
 
         is_child_flags = dataframe[column_name].duplicated(keep='first')
         
@@ -1221,6 +1291,7 @@ class ParentChildManager(QObject):
         self.db_backend = db_backend_instance
         self.current_group_column = column_name
         self.parent_child_data.clear()
+        self._allowed_indices_cache.clear()
 
         try:
             if progress_callback:
@@ -1246,6 +1317,7 @@ class ParentChildManager(QObject):
         self.db_backend = db_backend_instance
         self.current_group_column = column_name
         self.parent_child_data.clear()
+        self._allowed_indices_cache.clear()
         
         try:
             if progress_callback: progress_callback("親レコードを特定中...", 0, 1)
@@ -1285,6 +1357,22 @@ class ParentChildManager(QObject):
         except Exception as e:
             return False, f"DBエラー: {e}", 0
 
+    def allowed_indices_for(self, target_type):
+        """対象タイプ（all/parent/child）に該当する行インデックスの集合を返す（分析結果ごとにキャッシュ）"""
+        cached = self._allowed_indices_cache.get(target_type)
+        if cached is not None:
+            return cached
+
+        if target_type == "parent":
+            allowed = frozenset(self.get_parent_rows_indices())
+        elif target_type == "child":
+            allowed = frozenset(self.get_child_rows_indices())
+        else:
+            allowed = frozenset(self.parent_child_data)
+
+        self._allowed_indices_cache[target_type] = allowed
+        return allowed
+
     def get_parent_rows_indices(self):
         if not self.parent_child_data: return []
         return [idx for idx, data in self.parent_child_data.items() if data['is_parent']]
@@ -45,18 +45,18 @@ class FileIOController(QObject):
             self.main_window.welcome_widget.isVisible()
         )
         
-        view_stack_hidden = (
+        welcome_page_current = (
             hasattr(self.main_window, 'view_stack') and 
             self.main_window.main_window_is_initialized and # ui_main_window.py の setupUi が完了していることを保証
-            self.main_window.view_stack.isHidden()
+            self.main_window.view_stack.currentWidget() is self.main_window.welcome_widget
         )
         
         # table_model の rowCount() が 0 であること
         no_data = self.main_window.table_model.rowCount() == 0
         
-        result = welcome_visible and view_stack_hidden and no_data
+        result = welcome_visible and welcome_page_current and no_data
         print(f"DEBUG: ウェルカム画面判定 - welcome_visible: {welcome_visible}, "
-              f"view_stack_hidden: {view_stack_hidden}, no_data: {no_data} → {result}")
+              f"welcome_page_current: {welcome_page_current}, no_data: {no_data} → {result}")
         
         return result
         
@@ -289,6 +289,9 @@ class FileIOController(QObject):
     
     def save_file(self, filepath=None, is_save_as=True):
         """ファイルを保存"""
+        # カードビューで入力直後（モデル更新待ち）の内容もモデルへ反映してから保存する
+        self.main_window.view_controller.submit_card_edits()
+
         if self.main_window.is_readonly_mode():
             self.main_window.show_operation_status("このモードでは上書き保存できません。「名前を付けて保存」を使用してください。", 3000, True)
             return False
@@ -1,6 +1,6 @@
 # loading_overlay.py - 修正版
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QProgressBar
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QRect, Property, QEvent # QEvent をインポート
+from PySide6.QtCore import Qt, QTimer, QRect, Property, QEvent # QEvent をインポート
 from PySide6.QtGui import QPainter, QColor, QPalette
 
 class LoadingOverlay(QWidget):
@@ -68,22 +68,15 @@ class LoadingOverlay(QWidget):
         self.progress_bar.hide()  # 初期は非表示
         layout.addWidget(self.progress_bar)
         
-        # フェードインアニメーション
-        self.fade_animation = QPropertyAnimation(self, b"windowOpacity")
-        self.fade_animation.setDuration(200)
-        self.fade_animation.setStartValue(0.0)
-        self.fade_animation.setEndValue(1.0)
-        
         # 親ウィジェットのリサイズに追従
         if parent:
             parent.installEventFilter(self)
     
     def showEvent(self, event):
-        """表示時にセンタリングとアニメーション開始"""
+        """表示時にセンタリングとスピナー開始"""
         super().showEvent(event)
         self._center_container()
         self.spinner.start()
-        self.fade_animation.start()
     
     def hideEvent(self, event):
         """非表示時にアニメーション停止"""
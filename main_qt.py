@@ -11,10 +11,10 @@ from PySide6.QtWidgets import (
     QGroupBox, QScrollArea, QDockWidget, QButtonGroup,
     QFileDialog, QInputDialog, QProgressDialog, QDialogButtonBox,
     QHeaderView, QAbstractItemView, QStyle, QMenu, QSizePolicy,
-    QDataWidgetMapper, QToolBar
+    QDataWidgetMapper, QToolBar, QStackedWidget
 )
 from PySide6.QtGui import QKeySequence, QGuiApplication, QTextOption, QFont, QAction, QPalette, QIcon
-from PySide6.QtCore import Qt, Signal, Slot, QTimer, QModelIndex, QEvent, QItemSelectionModel, QObject, QItemSelection, QSize, QUrl, QPropertyAnimation
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QModelIndex, QEvent, QItemSelectionModel, QObject, QItemSelection, QSize, QUrl
 
 import config
 import pandas as pd
@@ -75,11 +75,11 @@ from table_operations import TableOperationsManager
 # dialogs.py から必要なダイアログクラスをインポート
 from dialogs import (
     MergeSeparatorDialog, PriceCalculatorDialog, PasteOptionDialog,
-    CSVSaveFormatDialog, TooltipEventFilter, EncodingSaveDialog,
-    TextProcessingDialog, RemoveDuplicatesDialog
+    CSVSaveFormatDialog, EncodingSaveDialog,
+    TextProcessingDialog, RemoveDuplicatesDialog, resolve_tooltip_text
 )
 
-from ui_main_window import Ui_MainWindow
+from ui_main_window import Ui_MainWindow, toolbar_width_tier, apply_toolbar_width_tier
 
 # 既存のimport文の後に追加
 from settings_manager import SettingsManager
@@ -115,6 +115,8 @@ class CsvEditorAppQt(QMainWindow):
 
         # `setupUi` の完了フラグを追加 (file_io_controller._is_welcome_screen_active で使用)
         self.main_window_is_initialized = False
+        # ツールバーに適用済みの幅段階（_adjust_toolbar_for_width で使用）
+        self._toolbar_width_tier = None
 
         # 🔧 ここから追加：コマンドライン引数の処理
         # filepathが指定されていない場合、コマンドライン引数をチェック
@@ -165,6 +167,7 @@ class CsvEditorAppQt(QMainWindow):
         # `table_model` は `setupUi` 呼び出し前に初期化されている必要がある)
         ui = Ui_MainWindow()
         ui.setupUi(self)
+        self._ui = ui # ウェルカム画面の遅延構築に使用
 
         # UI要素の存在確認と手動作成（ui_main_window.pyがない場合のフォールバック）
         essential_attrs = ['table_view', 'welcome_widget', 'status_label',
@@ -181,7 +184,7 @@ class CsvEditorAppQt(QMainWindow):
                            'price_calculator_action', 'save_format_action', 'shortcuts_action',
                            'view_toggle_action', 'test_action', 'prev_record_button', 'next_record_button',
                            'edit_menu', 'tools_menu', 'csv_format_menu', 'view_stack',
-                           'card_view_container', 'welcome_label',
+                           'card_page', 'card_view_container', 'welcome_label',
                            'text_processing_action', 'diagnose_action', 'force_show_action',
                            'remove_duplicates_action'
                            ]
@@ -201,19 +204,20 @@ class CsvEditorAppQt(QMainWindow):
             if not hasattr(self, 'card_scroll_area'): self.card_scroll_area = QScrollArea()
             if not hasattr(self, 'operation_label'): self.operation_label = QLabel()
             if not hasattr(self, 'view_stack'):
-                self.view_stack = QWidget()
+                self.view_stack = QStackedWidget()
                 self.setCentralWidget(self.view_stack)
-                self.view_stack_layout = QVBoxLayout(self.view_stack)
-                self.view_stack_layout.setContentsMargins(0,0,0,0)
-                self.view_stack_layout.addWidget(self.table_view)
-                if not hasattr(self, 'card_scroll_area'):
-                    self.view_stack_layout.addWidget(self.card_scroll_area)
+                self.view_stack.addWidget(self.table_view)
+            if not hasattr(self, 'card_page'):
+                # カード表示の切り替えは card_page を対象にするため、スクロール領域をページで包む
+                self.card_page = QWidget()
+                QVBoxLayout(self.card_page).addWidget(self.card_scroll_area)
+                self.view_stack.addWidget(self.card_page)
             if not hasattr(self, 'welcome_widget'):
                 self.welcome_widget = QWidget()
-                self.main_layout.addWidget(self.welcome_widget)
+                self.view_stack.addWidget(self.welcome_widget)
             if not hasattr(self, 'card_view_container'):
                 self.card_view_container = QWidget()
-                self.card_view_container.setLayout(QFormLayout())
+                self.card_view_container.setLayout(QGridLayout())
                 self.card_scroll_area.setWidget(self.card_view_container)
                 self.card_scroll_area.setWidgetResizable(True)
             if not hasattr(self, 'welcome_label'): self.welcome_label = QLabel("Welcome")
@@ -252,6 +256,13 @@ class CsvEditorAppQt(QMainWindow):
         self.pulse_timer.setSingleShot(True)
         self.pulsing_cells = set()
 
+        # ドラッグ選択やキー押しっぱなしでカレントセルが連続して変わる間は、
+        # アクション状態の再計算を1フレーム分（16ms）まとめてから1回だけ行う
+        self.action_state_timer = QTimer(self)
+        self.action_state_timer.setSingleShot(True)
+        self.action_state_timer.setInterval(16)
+        self.action_state_timer.timeout.connect(self._update_action_button_states)
+
         # card_mapper の初期化は table_model の後
         self.card_mapper = QDataWidgetMapper(self)
         self.card_mapper.setModel(self.table_model) # table_model がここで確実に存在する
@@ -289,8 +300,6 @@ class CsvEditorAppQt(QMainWindow):
         # アプリケーションの起動時の状態に応じて初期表示を決定
         if dataframe is not None:
             # 新規データとして初期化された場合 (open_new_window_with_new_data から呼ばれる)
-            self.view_stack.show()
-            self.welcome_widget.hide()
             self.view_controller.show_main_view() # メインビューを表示
             self.table_model.set_dataframe(dataframe) # データフレームを設定
             self.status_label.setText(f"新規ファイル ({len(dataframe):,}行, {len(dataframe.columns)}列)") # ステータスバーを更新
@@ -302,8 +311,7 @@ class CsvEditorAppQt(QMainWindow):
             # コマンドライン引数でファイルが指定された場合 (メインウィンドウで開く)
             print(f"DEBUG: ファイル自動読み込みを開始: {self.filepath}")
 
-            self.view_stack.hide()
-            self.welcome_widget.hide() # Welcome画面は隠す
+            self.view_stack.hide() # 読み込み完了まではどのページも表示しない
 
             self.status_label.setText(f"ファイル読み込み中: {os.path.basename(self.filepath)}")
             self.setWindowTitle(f"高機能CSVエディタ (PySide6) - {os.path.basename(self.filepath)} 読み込み中...")
@@ -313,8 +321,8 @@ class CsvEditorAppQt(QMainWindow):
             QTimer.singleShot(100, lambda: self._auto_open_file_with_dialog(self.filepath))
         else:
             # 通常起動でファイルが指定されていない場合 (ウェルカム画面表示)
-            self.view_stack.hide()
-            self.welcome_widget.show()
+            self.ensure_welcome_widget()
+            self.view_stack.setCurrentWidget(self.welcome_widget)
             self.setWindowTitle("高機能CSVエディタ (PySide6) - ファイルを開いてください。") # ウィンドウタイトルを更新
 
         self.settings_manager.load_window_settings(self)
@@ -425,6 +433,16 @@ class CsvEditorAppQt(QMainWindow):
         self.async_manager.product_discount_completed.connect(self._on_product_discount_completed)
         self.async_manager.bulk_extract_completed.connect(self._on_bulk_extract_completed)
 
+    def ensure_welcome_widget(self):
+        """ウェルカム画面の中身を初回表示時にだけ構築し、ボタンを接続する"""
+        if self.welcome_label is not None:
+            return
+        self._ui.build_welcome_contents(self)
+        # 🔥 修正のポイント：ウェルカム画面のボタンも file_io_controller に委譲
+        self.new_file_button_welcome.clicked.connect(self.file_controller.create_new_file)
+        self.open_file_button_welcome.clicked.connect(self.file_controller.open_file)
+        self.sample_data_button_welcome.clicked.connect(self.test_data)
+
     def _connect_signals(self):
         # QActionの接続
         self.new_action.triggered.connect(self.file_controller.create_new_file)
@@ -433,15 +451,7 @@ class CsvEditorAppQt(QMainWindow):
         self.save_as_action.triggered.connect(self.file_controller.save_as_with_dialog)
         self.exit_action.triggered.connect(self.close)
 
-        # ウェルカム画面のQPushButtonの接続
-        if hasattr(self, 'new_file_button_welcome') and self.new_file_button_welcome is not None:
-            # 🔥 修正のポイント：ウェルカム画面の新規作成ボタンも file_io_controller に委譲
-            self.new_file_button_welcome.clicked.connect(self.file_controller.create_new_file)
-        if hasattr(self, 'open_file_button_welcome') and self.open_file_button_welcome is not None:
-            # 🔥 修正のポイント：ウェルカム画面の開くボタンも file_io_controller に委譲
-            self.open_file_button_welcome.clicked.connect(self.file_controller.open_file)
-        if hasattr(self, 'sample_data_button_welcome') and self.sample_data_button_welcome is not None:
-            self.sample_data_button_welcome.clicked.connect(self.test_data)
+        # ウェルカム画面のQPushButtonは ensure_welcome_widget で作成時に接続する
 
         self.async_manager.data_ready.connect(self._on_async_data_ready)
         self.async_manager.task_progress.connect(self._update_progress_dialog)
@@ -664,16 +674,8 @@ class CsvEditorAppQt(QMainWindow):
         if not hasattr(self, 'loading_overlay') or not self.loading_overlay.isVisible():
             return
 
-        try:
-            fade_out = QPropertyAnimation(self.loading_overlay, b"windowOpacity")
-            fade_out.setDuration(300)
-            fade_out.setStartValue(1.0)
-            fade_out.setEndValue(0.0)
-            fade_out.finished.connect(self.loading_overlay.hide)
-            fade_out.start()
-        except Exception as e:
-            print(f"Warning: フェードアウトアニメーションエラー: {e}")
-            self.loading_overlay.hide()
+        # 子ウィジェットには windowOpacity が効かないため、フェードせずに即座に隠す
+        self.loading_overlay.hide()
 
     @Slot(str, int, int)
     def _update_loading_progress(self, status, current, total):
@@ -724,7 +726,6 @@ class CsvEditorAppQt(QMainWindow):
 
         self._set_ui_state('normal')
 
-        self.welcome_widget.hide()
         self.view_controller.show_main_view()
 
         mode_text = "通常モード"
@@ -1009,6 +1010,8 @@ class CsvEditorAppQt(QMainWindow):
         return is_lazy
 
     def show_operation_status(self, message, duration=2000, is_error=False):
+        if self.operation_label.parent() is None:
+            self.statusBar().insertPermanentWidget(0, self.operation_label)
         self.operation_label.setText(message)
         palette = self.operation_label.palette()
         color = self.theme.DANGER_QCOLOR if is_error else self.theme.TEXT_PRIMARY_QCOLOR
@@ -1045,6 +1048,9 @@ class CsvEditorAppQt(QMainWindow):
 
     def closeEvent(self, event):
         """アプリケーション終了時の処理（子ウィンドウ管理強化版）"""
+        # カードビューで入力直後（モデル更新待ち）の内容をモデルへ反映する
+        self.view_controller.submit_card_edits()
+
         # 設定の保存
         self.settings_manager.save_window_settings(self)
         self.settings_manager.save_toolbar_state(self)
@@ -1109,36 +1115,13 @@ class CsvEditorAppQt(QMainWindow):
         if not toolbar:
             return
 
-        if width < 1200:
-            toolbar.setToolButtonStyle(Qt.ToolButtonIconOnly)
-            toolbar.setIconSize(QSize(16, 16))
-            toolbar.setStyleSheet(toolbar.styleSheet() + """
-                QToolButton {
-                    min-width: 24px;
-                    font-size: 12px;
-                    padding: 1px 2px;
-                }
-            """)
-        elif width < 1600:
-            toolbar.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
-            toolbar.setIconSize(QSize(16, 16))
-            toolbar.setStyleSheet(toolbar.styleSheet() + """
-                QToolButton {
-                    min-width: 35px;
-                    font-size: 13px;
-                    padding: 2px 3px;
-                }
-            """)
-        else:
-            toolbar.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
-            toolbar.setIconSize(QSize(20, 20))
-            toolbar.setStyleSheet(toolbar.styleSheet() + """
-                QToolButton {
-                    min-width: 50px;
-                    font-size: 14px;
-                    padding: 2px 4px;
-                }
-            """)
+        # リサイズのドラッグ中は大量に呼ばれるため、幅の段階が変わったときだけ再設定する
+        tier = toolbar_width_tier(width)
+        if self._toolbar_width_tier == tier:
+            return
+        self._toolbar_width_tier = tier
+        # 段階ごとの固定のスタイルシートに置き換える（現在のものに連結すると際限なく長くなる）
+        apply_toolbar_width_tier(toolbar, tier)
 
     def _update_action_button_states(self):
         self._debug_selection_state()
@@ -1241,7 +1224,7 @@ class CsvEditorAppQt(QMainWindow):
         if current.isValid():
             self._pulse_cells([current])
             self.active_index = current
-        self._update_action_button_states()
+        self.action_state_timer.start()
         if self.card_mapper and not self.table_view.isHidden():
             self.card_mapper.setCurrentIndex(current.row())
 
@@ -1813,10 +1796,10 @@ Shift+Tab: 前のセルへ移動
 
         if self.search_panel:
             if "分析エラー" in summary_text:
-                self.search_panel.analysis_text.setText(summary_text)
+                self.search_panel.analysis_text.setPlainText(summary_text)
                 self.show_operation_status("親子関係の分析に失敗しました。", is_error=True)
             else:
-                self.search_panel.analysis_text.setText(summary_text)
+                self.search_panel.analysis_text.setPlainText(summary_text)
                 self.show_operation_status("親子関係を分析しました。")
 
     @Slot(list, str)
@@ -1965,7 +1948,7 @@ Shift+Tab: 前のセルへ移動
         if self.lazy_loader:
             QMessageBox.warning(self, "機能制限", "遅延読み込みモードでは親子関係の分析はできません。")
             if self.search_panel:
-                self.search_panel.analysis_text.setText("遅延読み込みモードでは親子関係の分析はできません。")
+                self.search_panel.analysis_text.setPlainText("遅延読み込みモードでは親子関係の分析はできません。")
             return
 
         self._show_progress_dialog("親子関係を分析中...", self.async_manager.cancel_current_task)
@@ -1978,7 +1961,7 @@ Shift+Tab: 前のセルへ移動
             if df_to_analyze is None or df_to_analyze.empty:
                 self._close_progress_dialog()
                 if self.search_panel:
-                    self.search_panel.analysis_text.setText("分析対象のデータがありません。")
+                    self.search_panel.analysis_text.setPlainText("分析対象のデータがありません。")
                 self.show_operation_status("分析対象のデータがありません。", is_error=True)
                 return
             success, msg, total_rows = self.parent_child_manager.analyze_relationships(df_to_analyze, column_name, analysis_mode)
@@ -1986,11 +1969,11 @@ Shift+Tab: 前のセルへ移動
             
             if success:
                 if self.search_panel:
-                    self.search_panel.analysis_text.setText(self.parent_child_manager.get_groups_summary())
+                    self.search_panel.analysis_text.setPlainText(self.parent_child_manager.get_groups_summary())
                 self.show_operation_status("親子関係を分析しました。")
             else:
                 if self.search_panel:
-                    self.search_panel.analysis_text.setText(f"分析エラー:\n{msg}")
+                    self.search_panel.analysis_text.setPlainText(f"分析エラー:\n{msg}")
                 self.show_operation_status("親子関係の分析に失敗しました。", is_error=True)
 
     def _toggle_view(self):
@@ -2239,6 +2222,7 @@ Shift+Tab: 前のセルへ移動
             emergency_toolbar.setIconSize(QSize(20, 20)) 
             emergency_toolbar.setToolButtonStyle(Qt.ToolButtonTextBesideIcon) 
             emergency_toolbar.setStyleSheet("") 
+            self._toolbar_width_tier = None
             
             QMessageBox.information(self, "復旧完了", 
                 "ツールバーを緊急復旧しました。\n" 
@@ -2436,21 +2420,11 @@ Shift+Tab: 前のセルへ移動
         if self.table_model.rowCount() == 0:
             QMessageBox.warning(self, "警告", "表示するデータがありません"); return
 
-        widgets_to_hide = [self.welcome_widget, self.card_scroll_area]
-        for widget in widgets_to_hide:
-            if widget is not None:
-                widget.hide()
-
-        if not hasattr(self, 'view_stack') or self.view_stack.layout() is None:
-            self.view_stack = QWidget()
-            self.setCentralWidget(self.view_stack)
-            self.view_stack_layout = QVBoxLayout(self.view_stack)
-            self.view_stack_layout.setContentsMargins(0,0,0,0)
-            self.view_stack_layout.addWidget(self.table_view)
-            self.view_stack_layout.addWidget(self.card_scroll_area)
+        if self.view_stack.indexOf(self.table_view) < 0:
+            self.view_stack.addWidget(self.table_view)
 
+        self.view_stack.setCurrentWidget(self.table_view)
         self.view_stack.show()
-        self.table_view.show()
 
         self.view_stack.repaint()
         self.table_view.viewport().repaint()
@@ -2575,8 +2549,9 @@ Shift+Tab: 前のセルへ移動
             print(f"ERROR: 自動ファイル読み込みでエラー: {e}")
             traceback.print_exc()
 
-            self.view_stack.hide()
-            self.welcome_widget.show()
+            self.ensure_welcome_widget()
+            self.view_stack.setCurrentWidget(self.welcome_widget)
+            self.view_stack.show()
             self.status_label.setText("ファイルを開いてください。")
             self.setWindowTitle("高機能CSVエディタ (PySide6)")
 
@@ -2647,16 +2622,13 @@ Shift+Tab: 前のセルへ移動
             self.new_action.setStatusTip("新しいウィンドウで新規CSVファイルを作成します")
         
         # ツールバーのツールチップも更新されるように強制的に再設定
-        # QAction のツールチップが変更された際に TooltipEventFilter が自動で拾うはずだが、念のため
-        if hasattr(self, 'tooltip_filters'):
-            for f in self.tooltip_filters:
-                if f.target_widget and f.text_callback: # target_widget と text_callback が存在することを確認
-                    f.target_widget.setToolTip(f.text_callback()) # 直接ツールチップを更新
-                    # QAction に statusTip を設定する
-                    if isinstance(f.target_widget, QAction):
-                        f.target_widget.setStatusTip(f.text_callback())
-                    elif hasattr(f.target_widget, 'setStatusTip'): # QToolButton など
-                        f.target_widget.setStatusTip(f.text_callback())
+        # QAction のツールチップが変更された際に SharedTooltipFilter が自動で拾うはずだが、念のため
+        if hasattr(self, 'tooltip_filter'):
+            for widget, text_callback in self.tooltip_filter.callbacks.items():
+                tooltip_text = resolve_tooltip_text(text_callback)
+                widget.setToolTip(tooltip_text) # 直接ツールチップを更新
+                if hasattr(widget, 'setStatusTip'): # QToolButton など
+                    widget.setStatusTip(tooltip_text)
 
 
     # 🔥 修正5: 初期化が正常に完了したかを検証するメソッド
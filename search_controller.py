@@ -1,6 +1,7 @@
 # search_controller.py
 
 import re
+import numpy as np
 import pandas as pd
 from PySide6.QtCore import QObject, Signal, Qt, QModelIndex, QItemSelectionModel
 from PySide6.QtWidgets import QApplication, QMessageBox, QAbstractItemView
@@ -477,18 +478,29 @@ class SearchController(QObject):
             self.main_window.show_operation_status(f"正規表現エラー: {e}", is_error=True)
             return
         
+        # 列ごとにまとめ、列名の取得と値配列の取り出しを列単位で一度だけ行う
+        rows_by_col = {}
         for row, col in filtered_indices:
-            index = self.main_window.table_model.index(row, col)
-            old_value = str(self.main_window.table_model.data(index, Qt.EditRole) or "")
-            new_value = pattern.sub(settings["replace_term"], old_value)
+            rows_by_col.setdefault(col, []).append(row)
+        
+        table_model = self.main_window.table_model
+        df = table_model._dataframe if table_model._backend is None else None
+        replace_term = settings["replace_term"]
+        
+        for col, rows in sorted(rows_by_col.items()):
+            column_name = table_model.headerData(col, Qt.Horizontal)
+            if df is not None and col < df.shape[1]:
+                column_values = df.iloc[:, col].to_numpy()
+                old_values = ["" if column_values[row] is None else str(column_values[row]) for row in rows]
+            else:
+                old_values = [str(table_model.data(table_model.index(row, col), Qt.EditRole) or "") for row in rows]
             
-            if old_value != new_value:
-                changes.append({
-                    'item': str(row),
-                    'column': self.main_window.table_model.headerData(col, Qt.Horizontal),
-                    'old': old_value,
-                    'new': new_value
-                })
+            replaced = ((row, old_value, pattern.sub(replace_term, old_value)) for row, old_value in zip(rows, old_values))
+            changes.extend(
+                {'item': str(row), 'column': column_name, 'old': old_value, 'new': new_value}
+                for row, old_value, new_value in replaced
+                if old_value != new_value
+            )
         
         if changes:
             action = {'type': 'edit', 'data': changes}
@@ -511,7 +523,7 @@ class SearchController(QObject):
             return #
 
         # 行インデックスを抽出 #
-        row_indices = sorted(list({idx[0] for idx in found_indices})) #
+        row_indices = np.unique(np.fromiter((idx[0] for idx in found_indices), dtype=np.int64, count=len(found_indices))).tolist()
         print(f"DEBUG: 抽出対象行インデックス: {row_indices[:5]}... ({len(row_indices)}件)") # デバッグログ追加
 
         extracted_df = None #
@@ -550,19 +562,8 @@ class SearchController(QObject):
             return []
         
         target_type = settings.get("target_type", "all")
-        filtered_results = []
-        
-        for row, col in results:
-            if row in self.main_window.parent_child_manager.parent_child_data:
-                parent_child_info = self.main_window.parent_child_manager.parent_child_data[row]
-                is_parent = parent_child_info['is_parent']
-                
-                if target_type == "all":
-                    filtered_results.append((row, col))
-                elif target_type == "parent" and is_parent:
-                    filtered_results.append((row, col))
-                elif target_type == "child" and not is_parent:
-                    filtered_results.append((row, col))
+        allowed = self.main_window.parent_child_manager.allowed_indices_for(target_type)
+        filtered_results = [(row, col) for row, col in results if row in allowed]
         
         return filtered_results
     
@@ -579,7 +580,7 @@ class SearchController(QObject):
         if self.main_window.lazy_loader:
             QMessageBox.warning(self.main_window, "機能制限", "遅延読み込みモードでは親子関係の分析はできません。")
             if self.main_window.search_panel:
-                self.main_window.search_panel.analysis_text.setText("遅延読み込みモードでは親子関係の分析はできません。")
+                self.main_window.search_panel.analysis_text.setPlainText("遅延読み込みモードでは親子関係の分析はできません。")
             return
 
         self.main_window._show_progress_dialog("親子関係を分析中...", self.main_window.async_manager.cancel_current_task)
@@ -594,7 +595,7 @@ class SearchController(QObject):
             if df_to_analyze is None or df_to_analyze.empty:
                 self.main_window._close_progress_dialog()
                 if self.main_window.search_panel:
-                    self.main_window.search_panel.analysis_text.setText("分析対象のデータがありません。")
+                    self.main_window.search_panel.analysis_text.setPlainText("分析対象のデータがありません。")
                 self.main_window.show_operation_status("分析対象のデータがありません。", is_error=True)
                 return
 
@@ -603,11 +604,11 @@ class SearchController(QObject):
             
             if success:
                 if self.main_window.search_panel:
-                    self.main_window.search_panel.analysis_text.setText(self.main_window.parent_child_manager.get_groups_summary())
+                    self.main_window.search_panel.analysis_text.setPlainText(self.main_window.parent_child_manager.get_groups_summary())
                 self.main_window.show_operation_status("親子関係を分析しました。")
             else:
                 if self.main_window.search_panel:
-                    self.main_window.search_panel.analysis_text.setText(f"分析エラー:\n{msg}")
+                    self.main_window.search_panel.analysis_text.setPlainText(f"分析エラー:\n{msg}")
                 self.main_window.show_operation_status("親子関係の分析に失敗しました。", is_error=True)
 
     # 以下の _execute_individual_replace_for_parent_child, _execute_extract_with_results, _filter_results_by_parent_child_mode, _analyze_parent_child_from_widget
@@ -4,7 +4,7 @@ import pandas as pd
 import re 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout,
-    QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QCheckBox, QRadioButton,
+    QLineEdit, QPlainTextEdit, QComboBox, QCheckBox, QRadioButton,
     QSpinBox, QDoubleSpinBox, QPushButton,
     QLabel, QProgressBar, QTableView, QListWidget, QAbstractItemView, 
     QGroupBox, QScrollArea, QDockWidget, QButtonGroup,
@@ -135,7 +135,7 @@ class SearchWidget(QWidget):
 
         self.analyze_button = QPushButton("親子関係を分析")
         parent_child_layout.addWidget(self.analyze_button)
-        self.analysis_text = QTextEdit()
+        self.analysis_text = QPlainTextEdit()
         self.analysis_text.setReadOnly(True)
         self.analysis_text.setPlaceholderText("分析結果が表示されます...")
         parent_child_layout.addWidget(self.analysis_text)
@@ -474,9 +474,8 @@ class SearchWidget(QWidget):
             return
             
         self.column_list_widget.clear()
-        # アイテムを追加
-        for header in self.headers:
-            self.column_list_widget.addItem(header)
+        # アイテムを一括追加
+        self.column_list_widget.addItems(self.headers)
         
         # デフォルトで最初の列を選択し、スクロール
         if self.column_list_widget.count() > 0:
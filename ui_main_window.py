@@ -1,21 +1,181 @@
 # ui_main_window.py
 
+from bisect import bisect_right
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QMenu, QToolBar, QStatusBar, QLabel, QPushButton, QProgressBar,
     QTableView, QHeaderView, QAbstractItemView, QStyle, QDockWidget,
-    QFormLayout, QTextEdit, QHBoxLayout, QScrollArea, QApplication # QApplication をインポート
+    QGridLayout, QTextEdit, QHBoxLayout, QScrollArea, QStackedWidget, QFrame, QApplication, # QApplication をインポート
+    QStyledItemDelegate, QStyleOptionViewItem
+)
+from PySide6.QtGui import QAction, QKeySequence, QBrush, QPalette
+from PySide6.QtCore import Qt, QSize, QTimer
+
+from dialogs import SharedTooltipFilter
+
+# 列幅の自動調整（読み込み後の resizeColumnsToContents と列境界のダブルクリック）で見本にする行数
+_RESIZE_CONTENTS_SAMPLE_ROWS = 100
+
+# 標準ショートカット名 → QKeySequence のキャッシュ（初回の setupUi で一度だけ作成）
+_STD_SHORTCUTS = {}
+_STD_SHORTCUT_NAMES = ('Open', 'Save', 'Quit', 'New', 'Undo', 'Redo', 'Cut', 'Copy', 'Paste', 'Delete', 'SelectAll', 'Find')
+
+# メニューのアクション定義: (MainWindowの属性名, 表示テキスト, ショートカット, 標準アイコン)
+# ショートカットは _STD_SHORTCUTS のキー名（標準キー）か、修飾キーとキーの組み合わせ（文字列の解析を省く）
+_FILE_ACTIONS = (
+    ("new_action", "新規作成(&N)", 'New', QStyle.SP_FileDialogNewFolder),
+    ("open_action", "開く(&O)...", 'Open', QStyle.SP_DialogOpenButton),
+    ("save_action", "上書き保存(&S)", 'Save', QStyle.SP_DialogSaveButton),
+    ("save_as_action", "名前を付けて保存(&A)...", None, None),
+    ("exit_action", "終了(&X)", 'Quit', None),
+)
+
+_EDIT_ACTIONS = (
+    ("undo_action", "元に戻す", 'Undo', None),
+    ("redo_action", "やり直し", 'Redo', None),
+    ("cut_action", "切り取り", 'Cut', None),
+    ("copy_action", "コピー", 'Copy', None),
+    ("paste_action", "貼り付け", 'Paste', None),
+    ("delete_action", "削除", 'Delete', None),
+    ("cell_concatenate_action", "セルの値を連結...", None, None),
+    ("column_concatenate_action", "列の値を連結...", None, None),
+    ("copy_column_action", "列をコピー", Qt.CTRL | Qt.SHIFT | Qt.Key_C, None),
+    ("paste_column_action", "列に貼り付け", Qt.CTRL | Qt.SHIFT | Qt.Key_V, None),
+    ("add_row_action", "行を追加", Qt.CTRL | Qt.Key_Plus, None),
+    ("add_column_action", "右に列を挿入", Qt.CTRL | Qt.SHIFT | Qt.Key_Plus, None),
+    ("delete_selected_rows_action", "選択行を削除", Qt.CTRL | Qt.Key_Minus, None),
+    ("delete_selected_column_action", "選択列を削除", Qt.CTRL | Qt.SHIFT | Qt.Key_Minus, None),
+    ("sort_asc_action", "現在の列を昇順でソート", Qt.CTRL | Qt.Key_Up, None),
+    ("sort_desc_action", "現在の列を降順でソート", Qt.CTRL | Qt.Key_Down, None),
+    ("clear_sort_action", "ソートをクリア", Qt.CTRL | Qt.Key_Backspace, None),
+    ("select_all_action", "すべて選択", 'SelectAll', None),
+    ("search_action", "検索パネル", 'Find', None),
+    ("remove_duplicates_action", "重複行を削除...", Qt.CTRL | Qt.SHIFT | Qt.Key_D, None),
 )
-from PySide6.QtGui import QAction, QKeySequence
-from PySide6.QtCore import Qt, QSize
 
-from dialogs import TooltipEventFilter
+# ウェルカム画面のボタン定義: (MainWindowの属性名, 表示テキスト, 標準アイコン)
+_WELCOME_BUTTONS = (
+    ("new_file_button_welcome", "新規作成", QStyle.SP_FileDialogNewFolder),
+    ("open_file_button_welcome", "ファイルを開く", QStyle.SP_DialogOpenButton),
+    ("sample_data_button_welcome", "サンプルデータ", QStyle.SP_FileDialogDetailedView),
+)
+
+# 画面幅の区切り（未満で次の段階）と、段階ごとのツールバーアイコンサイズ
+_TOOLBAR_WIDTH_BREAKPOINTS = (1400, 1800)
+_TOOLBAR_ICON_SIZES = (18, 20, 22)
+
+# メインツールバーのスタイルシート（固定文字列なのでモジュール読み込み時に一度だけ作る）
+_TOOLBAR_QSS = """
+    QToolButton {
+        padding: 2px 3px;
+        margin: 1px;
+        min-width: 30px;
+        max-width: 100px;
+        font-size: 8px;
+        font-weight: normal;
+    }
+    QToolButton:hover {
+        background-color: #E3F2FD;
+        border: 1px solid #2196F3;
+        border-radius: 2px;
+    }
+    QToolButton:pressed {
+        background-color: #BBDEFB;
+    }
+"""
+
+# 幅の段階ごとのツールバーのスタイルシート（共通部分 + 段階ごとのボタン寸法。切り替えのたびに連結しない）
+_TOOLBAR_TIER_QSS = tuple(_TOOLBAR_QSS + tier_qss for tier_qss in (
+    """
+    QToolButton {
+        min-width: 24px;
+        font-size: 12px;
+        padding: 1px 2px;
+    }
+""",
+    """
+    QToolButton {
+        min-width: 35px;
+        font-size: 13px;
+        padding: 2px 3px;
+    }
+""",
+    """
+    QToolButton {
+        min-width: 50px;
+        font-size: 14px;
+        padding: 2px 4px;
+    }
+""",
+))
+
+# 上書き保存ボタンのツールチップの固定部分（パスだけをホバー時に連結する）
+_SAVE_TIP_PREFIX = "現在の変更をファイルに上書き保存します (Ctrl+S)\nパス: "
+
+def toolbar_width_tier(width):
+    """幅が _TOOLBAR_WIDTH_BREAKPOINTS のどの段階（0〜2）に当たるかを返す"""
+    return bisect_right(_TOOLBAR_WIDTH_BREAKPOINTS, width)
+
+def apply_toolbar_width_tier(toolbar, tier):
+    """段階に応じたアイコンサイズとスタイルシートをツールバーに設定する"""
+    icon_px = _TOOLBAR_ICON_SIZES[tier]
+    toolbar.setIconSize(QSize(icon_px, icon_px))
+    toolbar.setStyleSheet(_TOOLBAR_TIER_QSS[tier])
+
+class FastItemDelegate(QStyledItemDelegate):
+    """セル描画でモデルに問い合わせるロールを表示・背景色・文字色の3つに絞るデリゲート"""
+
+    def initStyleOption(self, option, index):
+        # 既定の実装はフォント・配置・アイコン・チェック状態なども毎セル問い合わせるが、
+        # CsvTableModel はそれらを返さないので、使っているロールだけを読む
+        option.index = index
+        option.text = index.data(Qt.DisplayRole) or ""
+        # ビューが設定した縞模様（Alternate）などのフラグは残す
+        option.features |= QStyleOptionViewItem.HasDisplay
+        option.displayAlignment = Qt.AlignLeft | Qt.AlignVCenter
+
+        # 検索ハイライト・パルス表示用の背景色と文字色
+        background = index.data(Qt.BackgroundRole)
+        if background is not None:
+            option.backgroundBrush = QBrush(background)
+        foreground = index.data(Qt.ForegroundRole)
+        if foreground is not None:
+            option.palette.setBrush(QPalette.Text, QBrush(foreground))
+
 
 class Ui_MainWindow(object):
     """
     メインウィンドウのUI定義を専門に行うクラス。
     ロジックは含まず、ウィジェットの作成と配置のみを担当する。
     """
+    # standardIcon の解決結果を共有するキャッシュ（QStyle.StandardPixmap → QIcon）
+    _icon_cache = {}
+
+    @staticmethod
+    def _zero_margin(layout):
+        """余白と間隔をまとめて0にしたレイアウトを返す"""
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        return layout
+
     def setupUi(self, MainWindow):
+        if not _STD_SHORTCUTS:
+            for name in _STD_SHORTCUT_NAMES:
+                _STD_SHORTCUTS[name] = QKeySequence(getattr(QKeySequence, name))
+
+        # アイコンは初回のイベントループ後にまとめて設定する（起動時の描画を優先）
+        self._pending_icons = []
+
+        # 構築中のレイアウト・描画イベントをまとめ、最後に一度だけ再描画させる
+        MainWindow.setUpdatesEnabled(False)
+        try:
+            self._setup_widgets(MainWindow)
+        finally:
+            MainWindow.setUpdatesEnabled(True)
+
+        QTimer.singleShot(0, lambda: self._install_icons(MainWindow))
+
+    def _setup_widgets(self, MainWindow):
+        """setupUi の本体（ウィジェットの作成と配置）"""
         MainWindow.setObjectName("MainWindow")
         MainWindow.setWindowTitle("高機能CSVエディタ (PySide6)")
         MainWindow.setGeometry(100, 100, 1280, 720)
@@ -30,38 +190,53 @@ class Ui_MainWindow(object):
         # 中央ウィジェットとレイアウト
         MainWindow.central_widget = QWidget()
         MainWindow.setCentralWidget(MainWindow.central_widget)
-        MainWindow.main_layout = QVBoxLayout(MainWindow.central_widget)
-        MainWindow.main_layout.setContentsMargins(0, 0, 0, 0)
+        MainWindow.main_layout = self._zero_margin(QVBoxLayout(MainWindow.central_widget))
 
-        # ビューのスタック
-        MainWindow.view_stack = QWidget()
-        MainWindow.view_stack_layout = QVBoxLayout(MainWindow.view_stack)
-        MainWindow.view_stack_layout.setContentsMargins(0,0,0,0)
+        # ビューのスタック（テーブル / カード / ウェルカム画面のうち現在のページだけを表示）
+        MainWindow.view_stack = QStackedWidget()
 
         # テーブルビュー
         MainWindow.table_view = QTableView()
         MainWindow.table_view.setSortingEnabled(False)
         MainWindow.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         MainWindow.table_view.horizontalHeader().setStretchLastSection(True)
+        # 列幅を測るときは一定行数だけを見本にする
+        # （0 は「表示中の行だけ」だが、テーブルが非表示のときは全行を表示中とみなして走査してしまう）
+        MainWindow.table_view.horizontalHeader().setResizeContentsPrecision(_RESIZE_CONTENTS_SAMPLE_ROWS)
         MainWindow.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # 行高は固定（密度設定の row_height）なので、セル描画時の折り返し計算を行わない
+        MainWindow.table_view.setWordWrap(False)
+        MainWindow.table_view.setTextElideMode(Qt.ElideRight)
+        # 縞模様はモデルのBackgroundRoleではなくビュー側で塗る（スタイルシートの alternate-background-color）
+        MainWindow.table_view.setAlternatingRowColors(True)
+        # ピクセル単位でスクロールし、新しく見えた帯だけを再描画させる
+        MainWindow.table_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        MainWindow.table_view.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        # セル描画時のモデル問い合わせを使っているロールだけに絞る
+        MainWindow.table_view.setItemDelegate(FastItemDelegate(MainWindow.table_view))
         
         # 🔥 修正: 選択動作を修正
         MainWindow.table_view.setSelectionBehavior(QAbstractItemView.SelectItems)
         MainWindow.table_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
         
-        # 🔥 追加: 行・列ヘッダーの選択を有効化
-        MainWindow.table_view.horizontalHeader().setSectionsClickable(True)
-        MainWindow.table_view.verticalHeader().setSectionsClickable(True)
+        # 行・列ヘッダーのクリック選択は QTableView の既定で有効（setSectionsClickable(True) 済み）
         
         MainWindow.table_view.setContextMenuPolicy(Qt.CustomContextMenu)
         MainWindow.table_view.setFocusPolicy(Qt.StrongFocus)
-        MainWindow.view_stack_layout.addWidget(MainWindow.table_view)
+        MainWindow.view_stack.addWidget(MainWindow.table_view)
+
+        # カードビューのページ（固定のナビゲーションボタン + フィールドのスクロールエリア）
+        MainWindow.card_page = QWidget()
+        card_page_layout = self._zero_margin(QVBoxLayout(MainWindow.card_page))
+        card_page_layout.addLayout(self._create_card_nav_bar(MainWindow))
 
         # スクロールエリアを作成
         MainWindow.card_scroll_area = QScrollArea()
         MainWindow.card_scroll_area.setWidgetResizable(True)
         MainWindow.card_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         MainWindow.card_scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        # 枠線は描かない（スクロール時に枠ごと再描画させない）
+        MainWindow.card_scroll_area.setFrameShape(QFrame.NoFrame)
 
         # カードビューのコンテナを作成（スクロールエリアの中身）
         MainWindow.card_view_container = QWidget()
@@ -70,19 +245,52 @@ class Ui_MainWindow(object):
         # コンテナをスクロールエリアにセット
         MainWindow.card_scroll_area.setWidget(MainWindow.card_view_container)
 
-        # スクロールエリアをビューのスタックに追加
-        MainWindow.view_stack_layout.addWidget(MainWindow.card_scroll_area)
-        MainWindow.card_scroll_area.hide()
+        # カードページをビューのスタックに追加
+        card_page_layout.addWidget(MainWindow.card_scroll_area)
+        MainWindow.view_stack.addWidget(MainWindow.card_page)
 
         # 🔥 重要: view_stackをmain_layoutに追加
         MainWindow.main_layout.addWidget(MainWindow.view_stack)
-        
-        # 🔥 追加: 初期状態でview_stackを非表示にする（ウェルカム画面を表示するため）
-        MainWindow.view_stack.hide()
 
         # 🔥 修正: ウェルカム画面の定義を ui_main_window.py に集約
+        # 中身（ラベル・ボタン）は表示が必要になった時点で build_welcome_contents が作る
         MainWindow.welcome_widget = QWidget()
         MainWindow.welcome_widget.setObjectName("welcome_widget") # Stylesheet用にオブジェクト名を設定
+        MainWindow.welcome_label = None
+        MainWindow.new_file_button_welcome = None
+        MainWindow.open_file_button_welcome = None
+        MainWindow.sample_data_button_welcome = None
+
+        # ウェルカムウィジェットをビューのスタックに追加
+        MainWindow.view_stack.addWidget(MainWindow.welcome_widget)
+        
+        # 初期状態でウェルカム画面を表示
+        MainWindow.view_stack.setCurrentWidget(MainWindow.welcome_widget)
+
+        # ステータスバーの作成
+        self._create_status_bar(MainWindow)
+
+    def _defer_icon(self, target, standard_pixmap):
+        """アクションやボタンのアイコン設定を _install_icons まで遅延する"""
+        self._pending_icons.append((target, standard_pixmap))
+
+    @classmethod
+    def standard_icon(cls, style, standard_pixmap):
+        """標準アイコンをキャッシュ経由で取得する（style は呼び出し側で一度だけ取得しておく）"""
+        icon = cls._icon_cache.get(standard_pixmap)
+        if icon is None:
+            icon = cls._icon_cache[standard_pixmap] = style.standardIcon(standard_pixmap)
+        return icon
+
+    def _install_icons(self, MainWindow):
+        """遅延していたアイコンをまとめて設定する"""
+        style = MainWindow.style()
+        for target, standard_pixmap in self._pending_icons:
+            target.setIcon(self.standard_icon(style, standard_pixmap))
+        self._pending_icons.clear()
+
+    def build_welcome_contents(self, MainWindow):
+        """ウェルカム画面のラベルとボタンを作成する（初回表示時に一度だけ呼ばれる）"""
         welcome_layout = QVBoxLayout(MainWindow.welcome_widget)
         welcome_layout.setContentsMargins(50, 50, 50, 50) # マージンを追加
 
@@ -106,26 +314,16 @@ class Ui_MainWindow(object):
         button_layout = QHBoxLayout(button_container)
         button_layout.setSpacing(20)
 
-        # ボタンの作成とMainWindow属性への割り当て
-        MainWindow.new_file_button_welcome = QPushButton("新規作成", MainWindow) #
-        MainWindow.open_file_button_welcome = QPushButton("ファイルを開く", MainWindow) #
-        MainWindow.sample_data_button_welcome = QPushButton("サンプルデータ", MainWindow) #
-
-        # ボタンのサイズとアイコン設定
-        for btn in [MainWindow.new_file_button_welcome, MainWindow.open_file_button_welcome, MainWindow.sample_data_button_welcome]: #
-            btn.setMinimumSize(150, 50) #
-            btn.setStyleSheet("font-weight: bold;")
-
-        # アイコン設定
-        MainWindow.new_file_button_welcome.setIcon(MainWindow.style().standardIcon(QStyle.SP_FileDialogNewFolder))
-        MainWindow.open_file_button_welcome.setIcon(MainWindow.style().standardIcon(QStyle.SP_DialogOpenButton))
-        MainWindow.sample_data_button_welcome.setIcon(MainWindow.style().standardIcon(QStyle.SP_FileDialogDetailedView))
-
-        # ボタンをレイアウトに追加
+        # ボタンの作成・サイズ・アイコン設定とMainWindow属性への割り当て
+        # （太字などの見た目はアプリ全体のスタイルシートの QWidget#welcome_widget QPushButton で指定）
+        style = MainWindow.style()
         button_layout.addStretch()
-        button_layout.addWidget(MainWindow.new_file_button_welcome)
-        button_layout.addWidget(MainWindow.open_file_button_welcome)
-        button_layout.addWidget(MainWindow.sample_data_button_welcome)
+        for attr, text, standard_pixmap in _WELCOME_BUTTONS:
+            btn = QPushButton(text, MainWindow)
+            btn.setMinimumSize(150, 50)
+            btn.setIcon(self.standard_icon(style, standard_pixmap))
+            setattr(MainWindow, attr, btn)
+            button_layout.addWidget(btn)
         button_layout.addStretch()
 
         # 全体レイアウトに追加
@@ -138,126 +336,54 @@ class Ui_MainWindow(object):
         welcome_layout.addSpacing(30)
         welcome_layout.addStretch(2)
 
-        # ウェルカムウィジェットをメインレイアウトに追加
-        MainWindow.main_layout.addWidget(MainWindow.welcome_widget)
-        
-        # 初期状態でウェルカム画面を表示
-        MainWindow.welcome_widget.show()
-
-        # ステータスバーの作成
-        self._create_status_bar(MainWindow)
-
     def _create_menu_bar(self, MainWindow):
         menuBar = MainWindow.menuBar()
         file_menu = menuBar.addMenu("ファイル(&F)")
-        MainWindow.open_action = QAction(MainWindow.style().standardIcon(QStyle.SP_DialogOpenButton), "開く(&O)...", MainWindow)
-        MainWindow.open_action.setShortcut(QKeySequence.Open)
-        MainWindow.save_action = QAction(MainWindow.style().standardIcon(QStyle.SP_DialogSaveButton), "上書き保存(&S)", MainWindow)
-        MainWindow.save_action.setShortcut(QKeySequence.Save)
-        MainWindow.save_as_action = QAction("名前を付けて保存(&A)...", MainWindow)
-        MainWindow.exit_action = QAction("終了(&X)", MainWindow)
-        MainWindow.exit_action.setShortcut(QKeySequence.Quit)
-        
-        MainWindow.new_action = QAction(MainWindow.style().standardIcon(QStyle.SP_FileDialogNewFolder), "新規作成(&N)", MainWindow)
-        MainWindow.new_action.setShortcut(QKeySequence.New)
+        self._create_actions(MainWindow, _FILE_ACTIONS)
 
-        file_menu.addAction(MainWindow.new_action)
-        file_menu.addAction(MainWindow.open_action)
-        file_menu.addAction(MainWindow.save_action)
-        file_menu.addAction(MainWindow.save_as_action)
+        file_menu.addActions([MainWindow.new_action, MainWindow.open_action,
+                              MainWindow.save_action, MainWindow.save_as_action])
         file_menu.addSeparator()
         file_menu.addAction(MainWindow.exit_action)
 
         MainWindow.edit_menu = menuBar.addMenu("編集(&E)")
-        MainWindow.undo_action = QAction("元に戻す", MainWindow)
-        MainWindow.undo_action.setShortcut(QKeySequence.Undo)
-        MainWindow.redo_action = QAction("やり直し", MainWindow)
-        MainWindow.redo_action.setShortcut(QKeySequence.Redo)
-        MainWindow.cut_action = QAction("切り取り", MainWindow)
-        MainWindow.cut_action.setShortcut(QKeySequence.Cut)
-        MainWindow.copy_action = QAction("コピー", MainWindow)
-        MainWindow.copy_action.setShortcut(QKeySequence.Copy)
-        MainWindow.paste_action = QAction("貼り付け", MainWindow)
-        MainWindow.paste_action.setShortcut(QKeySequence.Paste)
-        MainWindow.delete_action = QAction("削除", MainWindow)
-        MainWindow.delete_action.setShortcut(QKeySequence.Delete)
-        MainWindow.cell_concatenate_action = QAction("セルの値を連結...", MainWindow)
-        MainWindow.column_concatenate_action = QAction("列の値を連結...", MainWindow)
-        merge_menu = QMenu("連結", MainWindow)
-        merge_menu.addAction(MainWindow.cell_concatenate_action)
-        merge_menu.addAction(MainWindow.column_concatenate_action)
-        MainWindow.copy_column_action = QAction("列をコピー", MainWindow)
-        MainWindow.copy_column_action.setShortcut(QKeySequence("Ctrl+Shift+C"))
-        MainWindow.paste_column_action = QAction("列に貼り付け", MainWindow)
-        MainWindow.paste_column_action.setShortcut(QKeySequence("Ctrl+Shift+V"))
-        MainWindow.add_row_action = QAction("行を追加", MainWindow)
-        # 修正2: 行・列操作のショートカットを追加
-        MainWindow.add_row_action.setShortcut(QKeySequence("Ctrl++"))
-        MainWindow.add_column_action = QAction("右に列を挿入", MainWindow)
-        MainWindow.add_column_action.setShortcut(QKeySequence("Ctrl+Shift++"))
-        MainWindow.delete_selected_rows_action = QAction("選択行を削除", MainWindow)
-        MainWindow.delete_selected_rows_action.setShortcut(QKeySequence("Ctrl+-"))
-        MainWindow.delete_selected_column_action = QAction("選択列を削除", MainWindow)
-        MainWindow.delete_selected_column_action.setShortcut(QKeySequence("Ctrl+Shift+-"))
-
-        sort_menu = QMenu("ソート", MainWindow)
-        MainWindow.sort_asc_action = QAction("現在の列を昇順でソート", MainWindow)
-        # 修正2: ソートアクションにショートカット追加
-        MainWindow.sort_asc_action.setShortcut(QKeySequence("Ctrl+Up"))
-        MainWindow.sort_desc_action = QAction("現在の列を降順でソート", MainWindow)
-        MainWindow.sort_desc_action.setShortcut(QKeySequence("Ctrl+Down"))
-        MainWindow.clear_sort_action = QAction("ソートをクリア", MainWindow)
-        MainWindow.clear_sort_action.setShortcut(QKeySequence("Ctrl+Backspace"))
-        sort_menu.addAction(MainWindow.sort_asc_action)
-        sort_menu.addAction(MainWindow.sort_desc_action)
-        sort_menu.addSeparator()
-        sort_menu.addAction(MainWindow.clear_sort_action)
-        MainWindow.select_all_action = QAction("すべて選択", MainWindow)
-        MainWindow.select_all_action.setShortcut(QKeySequence.SelectAll)
-        MainWindow.search_action = QAction("検索パネル", MainWindow)
-        MainWindow.search_action.setShortcut(QKeySequence.Find)
-        
-        # 重複行削除アクションの追加
-        MainWindow.remove_duplicates_action = QAction("重複行を削除...", MainWindow)
-        MainWindow.remove_duplicates_action.setShortcut(QKeySequence("Ctrl+Shift+D"))
+        self._create_actions(MainWindow, _EDIT_ACTIONS)
 
         # 修正2: ビュー切り替えにショートカット追加
-        MainWindow.view_toggle_action = QAction(MainWindow.style().standardIcon(QStyle.SP_FileDialogDetailedView), "カードビュー", MainWindow)
-        MainWindow.view_toggle_action.setShortcut(QKeySequence("Ctrl+Tab"))
-
-
-        MainWindow.edit_menu.addAction(MainWindow.undo_action)
-        MainWindow.edit_menu.addAction(MainWindow.redo_action)
-        MainWindow.edit_menu.addSeparator()
-        MainWindow.edit_menu.addAction(MainWindow.cut_action)
-        MainWindow.edit_menu.addAction(MainWindow.copy_action)
-        MainWindow.edit_menu.addAction(MainWindow.paste_action)
-        MainWindow.edit_menu.addAction(MainWindow.delete_action)
-        MainWindow.edit_menu.addSeparator()
-        MainWindow.edit_menu.addMenu(merge_menu)
-        MainWindow.edit_menu.addSeparator()
-        MainWindow.edit_menu.addAction(MainWindow.copy_column_action)
-        MainWindow.edit_menu.addAction(MainWindow.paste_column_action)
-        MainWindow.edit_menu.addSeparator()
-        MainWindow.edit_menu.addAction(MainWindow.add_row_action)
-        MainWindow.edit_menu.addAction(MainWindow.add_column_action)
-        MainWindow.edit_menu.addAction(MainWindow.delete_selected_rows_action)
-        MainWindow.edit_menu.addAction(MainWindow.delete_selected_column_action)
-        MainWindow.edit_menu.addSeparator()
-        MainWindow.edit_menu.addMenu(sort_menu)
-        MainWindow.edit_menu.addSeparator()
-        MainWindow.edit_menu.addAction(MainWindow.select_all_action)
-        MainWindow.edit_menu.addSeparator()
-        MainWindow.edit_menu.addAction(MainWindow.search_action)
-        MainWindow.edit_menu.addSeparator() #
-        MainWindow.edit_menu.addAction(MainWindow.remove_duplicates_action) #
-
+        MainWindow.view_toggle_action = QAction("カードビュー", MainWindow)
+        self._defer_icon(MainWindow.view_toggle_action, QStyle.SP_FileDialogDetailedView)
+        MainWindow.view_toggle_action.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_Tab))
+
+
+        # 区切りごとのまとまりを addActions で一度に追加する
+        # 連結・ソートは項目が少ないのでサブメニューにせず、セクション見出しの下に並べる
+        edit_menu = MainWindow.edit_menu
+        edit_menu.addActions([MainWindow.undo_action, MainWindow.redo_action])
+        edit_menu.addSeparator()
+        edit_menu.addActions([MainWindow.cut_action, MainWindow.copy_action,
+                              MainWindow.paste_action, MainWindow.delete_action])
+        edit_menu.addSection("連結")
+        edit_menu.addActions([MainWindow.cell_concatenate_action, MainWindow.column_concatenate_action])
+        edit_menu.addSeparator()
+        edit_menu.addActions([MainWindow.copy_column_action, MainWindow.paste_column_action])
+        edit_menu.addSeparator()
+        edit_menu.addActions([MainWindow.add_row_action, MainWindow.add_column_action,
+                              MainWindow.delete_selected_rows_action, MainWindow.delete_selected_column_action])
+        edit_menu.addSection("ソート")
+        edit_menu.addActions([MainWindow.sort_asc_action, MainWindow.sort_desc_action, MainWindow.clear_sort_action])
+        edit_menu.addSeparator()
+        edit_menu.addAction(MainWindow.select_all_action)
+        edit_menu.addSeparator()
+        edit_menu.addAction(MainWindow.search_action)
+        edit_menu.addSeparator()
+        edit_menu.addAction(MainWindow.remove_duplicates_action)
+
+        # トップレベルメニューは最初から中身を入れておく（空のメニューはネイティブのメニューバーで
+        # 隠されたり無効になったりして aboutToShow が届かないため、初回表示時には作らない）
         MainWindow.tools_menu = menuBar.addMenu("ツール(&T)")
         MainWindow.price_calculator_action = QAction("金額計算ツール...", MainWindow)
-        MainWindow.tools_menu.addAction(MainWindow.price_calculator_action)
-        
         MainWindow.text_processing_action = QAction("テキスト処理ツール...", MainWindow)
-        MainWindow.tools_menu.addAction(MainWindow.text_processing_action)
+        MainWindow.tools_menu.addActions([MainWindow.price_calculator_action, MainWindow.text_processing_action])
 
         MainWindow.csv_format_menu = menuBar.addMenu("CSVフォーマット(&C)")
         MainWindow.save_format_action = QAction("保存形式を指定して保存...", MainWindow)
@@ -265,25 +391,33 @@ class Ui_MainWindow(object):
 
         help_menu = menuBar.addMenu("ヘルプ(&H)")
         MainWindow.shortcuts_action = QAction("ショートカットキー一覧", MainWindow)
-        help_menu.addAction(MainWindow.shortcuts_action)
-        
-        # 🔧 開発者向け機能を分離
-        help_menu.addSeparator()
-        dev_menu = help_menu.addMenu("開発者機能")
-        
-        # テスト・デバッグ機能をここに集約
+        # テスト・デバッグ機能（ヘルプ > 開発者機能 に並ぶ）
         MainWindow.test_action = QAction("サンプルデータ読み込み", MainWindow)
         MainWindow.diagnose_action = QAction("表示診断", MainWindow)
         MainWindow.force_show_action = QAction("強制表示", MainWindow)
-        
-        dev_menu.addAction(MainWindow.test_action)
-        dev_menu.addAction(MainWindow.diagnose_action)
-        dev_menu.addAction(MainWindow.force_show_action)
-        
-        # 🔧 本番環境では非表示
+        self._populate_help_menu(MainWindow, help_menu)
+
+    def _create_actions(self, MainWindow, action_table):
+        """(属性名, テキスト, ショートカット, アイコン) の表から QAction を作り MainWindow に設定する"""
+        for attr, text, shortcut, standard_pixmap in action_table:
+            action = QAction(text, MainWindow)
+            if isinstance(shortcut, str):
+                action.setShortcut(_STD_SHORTCUTS[shortcut])
+            elif shortcut is not None:
+                action.setShortcut(QKeySequence(shortcut))
+            if standard_pixmap is not None:
+                self._defer_icon(action, standard_pixmap)
+            setattr(MainWindow, attr, action)
+
+    def _populate_help_menu(self, MainWindow, help_menu):
+        help_menu.addAction(MainWindow.shortcuts_action)
+
+        # 🔧 開発者向け機能を分離（本番環境ではサブメニュー自体を作らない）
         import os
-        if os.environ.get('CSV_EDITOR_DEBUG', '0') != '1':
-            dev_menu.menuAction().setVisible(False)
+        if os.environ.get('CSV_EDITOR_DEBUG', '0') == '1':
+            help_menu.addSeparator()
+            dev_menu = help_menu.addMenu("開発者機能")
+            dev_menu.addActions([MainWindow.test_action, MainWindow.diagnose_action, MainWindow.force_show_action])
 
         # 🚨 安全対策と緊急復旧
         help_menu.addSeparator()
@@ -296,100 +430,76 @@ class Ui_MainWindow(object):
         toolbar.setObjectName("MainToolbar") # 🔧 状態保存用の識別名
         
         # 🔧 画面サイズに応じた初期設定
-        screen = QApplication.primaryScreen().geometry()
-        if screen.width() < 1400:
-            toolbar.setIconSize(QSize(18, 18))
-            toolbar.setToolButtonStyle(Qt.ToolButtonIconOnly)
-        elif screen.width() < 1800:
-            toolbar.setIconSize(QSize(20, 20))
-            toolbar.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
-        else:
-            toolbar.setIconSize(QSize(22, 22))
-            toolbar.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+        screen_width = QApplication.primaryScreen().geometry().width()
+        icon_px = _TOOLBAR_ICON_SIZES[toolbar_width_tier(screen_width)]
+        toolbar.setIconSize(QSize(icon_px, icon_px))
+        # ラベルはツールチップで表示するので、ボタンはアイコンのみ（文字の計測・描画を省く）
+        toolbar.setToolButtonStyle(Qt.ToolButtonIconOnly)
         
         # 🔧 最適化されたスタイルシート
-        toolbar.setStyleSheet("""
-            QToolButton {
-                padding: 2px 3px;
-                margin: 1px;
-                min-width: 30px;
-                max-width: 100px;
-                font-size: 8px;
-                font-weight: normal;
-            }
-            QToolButton:hover {
-                background-color: #E3F2FD;
-                border: 1px solid #2196F3;
-                border-radius: 2px;
-            }
-            QToolButton:pressed {
-                background-color: #BBDEFB;
-            }
-        """)
+        toolbar.setStyleSheet(_TOOLBAR_QSS)
         
+        # ツールバーのボタン全体で1つのツールチップフィルターを共有する
+        MainWindow.tooltip_filter = SharedTooltipFilter(MainWindow)
+        register_tooltip = MainWindow.tooltip_filter.register
+
         def add_action_with_tooltip(action, text_callback):
             toolbar.addAction(action)
-            action.setText(action.text().replace("✂️ ", "").replace("📋 ", "").replace("📎 ", "").replace("🗑️ ", "").replace("📊 ", "").replace("💰 ", ""))
             widget = toolbar.widgetForAction(action)
             if widget:
-                # TooltipEventFilter をインストールし、text_callback を渡す
-                tooltip_filter = TooltipEventFilter(widget, text_callback)
-                widget.installEventFilter(tooltip_filter)
-                # MainWindow に tooltip_filters リストを追加して、参照を保持する
-                # これにより、フィルタがガベージコレクションされないようにする
-                if not hasattr(MainWindow, 'tooltip_filters'):
-                    MainWindow.tooltip_filters = []
-                MainWindow.tooltip_filters.append(tooltip_filter)
+                register_tooltip(widget, text_callback)
                 
         # グループ1: ファイル操作
         # 🔥 修正のポイント：ツールチップのテキストを動的にする
         add_action_with_tooltip(MainWindow.new_action, lambda: MainWindow.new_action.toolTip() or "新規作成")
         add_action_with_tooltip(MainWindow.open_action, lambda: MainWindow.open_action.toolTip() or "開く")
-        add_action_with_tooltip(MainWindow.save_action, lambda: f"現在の変更をファイルに上書き保存します (Ctrl+S)\nパス: {MainWindow.filepath or '未保存'}")
+        add_action_with_tooltip(MainWindow.save_action, lambda: _SAVE_TIP_PREFIX + (MainWindow.filepath or '未保存'))
         toolbar.addSeparator()
         # グループ2: 編集操作
-        MainWindow.undo_action.setIcon(MainWindow.style().standardIcon(QStyle.SP_ArrowBack))
-        MainWindow.redo_action.setIcon(MainWindow.style().standardIcon(QStyle.SP_ArrowForward))
-        add_action_with_tooltip(MainWindow.undo_action, lambda: "操作を元に戻します (Ctrl+Z)")
-        add_action_with_tooltip(MainWindow.redo_action, lambda: "操作をやり直します (Ctrl+Y)")
+        self._defer_icon(MainWindow.undo_action, QStyle.SP_ArrowBack)
+        self._defer_icon(MainWindow.redo_action, QStyle.SP_ArrowForward)
+        add_action_with_tooltip(MainWindow.undo_action, "操作を元に戻します (Ctrl+Z)")
+        add_action_with_tooltip(MainWindow.redo_action, "操作をやり直します (Ctrl+Y)")
         toolbar.addSeparator()
         
         # グループ3: 行・列の操作
-        MainWindow.add_row_action.setIcon(MainWindow.style().standardIcon(QStyle.SP_FileIcon))
-        MainWindow.add_column_action.setIcon(MainWindow.style().standardIcon(QStyle.SP_ArrowRight))
-        MainWindow.delete_selected_rows_action.setIcon(MainWindow.style().standardIcon(QStyle.SP_TrashIcon))
+        self._defer_icon(MainWindow.add_row_action, QStyle.SP_FileIcon)
+        self._defer_icon(MainWindow.add_column_action, QStyle.SP_ArrowRight)
+        self._defer_icon(MainWindow.delete_selected_rows_action, QStyle.SP_TrashIcon)
         
-        add_action_with_tooltip(MainWindow.add_row_action, lambda: "カーソル位置の下に新しい行を追加します (Ctrl++)")
-        add_action_with_tooltip(MainWindow.add_column_action, lambda: "カーソル位置の右に新しい列を挿入します (Ctrl+Shift++)")
-        add_action_with_tooltip(MainWindow.delete_selected_rows_action, lambda: "選択されている行を削除します (Ctrl+-)")
+        add_action_with_tooltip(MainWindow.add_row_action, "カーソル位置の下に新しい行を追加します (Ctrl++)")
+        add_action_with_tooltip(MainWindow.add_column_action, "カーソル位置の右に新しい列を挿入します (Ctrl+Shift++)")
+        add_action_with_tooltip(MainWindow.delete_selected_rows_action, "選択されている行を削除します (Ctrl+-)")
         toolbar.addSeparator()
         
         # グループ4: 検索と表示
-        MainWindow.search_action.setIcon(MainWindow.style().standardIcon(QStyle.SP_FileDialogInfoView))
+        self._defer_icon(MainWindow.search_action, QStyle.SP_FileDialogInfoView)
         MainWindow.search_action.setText("検索パネル")
-        add_action_with_tooltip(MainWindow.search_action, lambda: "検索・置換・抽出パネルの表示/非表示 (Ctrl+F)")
+        add_action_with_tooltip(MainWindow.search_action, "検索・置換・抽出パネルの表示/非表示 (Ctrl+F)")
         
-        add_action_with_tooltip(MainWindow.view_toggle_action, lambda: "テーブル表示とカード表示を切り替えます (Ctrl+Tab)")
+        add_action_with_tooltip(MainWindow.view_toggle_action, "テーブル表示とカード表示を切り替えます (Ctrl+Tab)")
         toolbar.addSeparator()
         
         # グループ5: 高度な機能
-        MainWindow.price_calculator_action.setIcon(MainWindow.style().standardIcon(QStyle.SP_DialogApplyButton))
+        self._defer_icon(MainWindow.price_calculator_action, QStyle.SP_DialogApplyButton)
         MainWindow.price_calculator_action.setText("金額計算") # 🔧 テキスト短縮
-        add_action_with_tooltip(MainWindow.price_calculator_action, lambda: "選択列の金額を一括計算します")
+        add_action_with_tooltip(MainWindow.price_calculator_action, "選択列の金額を一括計算します")
         toolbar.addSeparator()
         
-        MainWindow.text_processing_action.setIcon(MainWindow.style().standardIcon(QStyle.SP_FileDialogContentsView))
+        self._defer_icon(MainWindow.text_processing_action, QStyle.SP_FileDialogContentsView)
         MainWindow.text_processing_action.setText("テキスト処理") # 🔧 テキスト短縮
         add_action_with_tooltip(
             MainWindow.text_processing_action,
-            lambda: "テキストに接頭辞追加・バイト数制限・単語境界調整を行います"
+            "テキストに接頭辞追加・バイト数制限・単語境界調整を行います"
         )
         toolbar.addSeparator()
         
+        self._defer_icon(MainWindow.cell_concatenate_action, QStyle.SP_FileLinkIcon)
+        self._defer_icon(MainWindow.column_concatenate_action, QStyle.SP_DirLinkIcon)
         MainWindow.cell_concatenate_action.setText("セル連結")
         MainWindow.column_concatenate_action.setText("列連結")
-        add_action_with_tooltip(MainWindow.cell_concatenate_action, lambda: "選択セルを隣のセルと連結します")
-        add_action_with_tooltip(MainWindow.column_concatenate_action, lambda: "選択列を隣の列と連結します")
+        add_action_with_tooltip(MainWindow.cell_concatenate_action, "選択セルを隣のセルと連結します")
+        add_action_with_tooltip(MainWindow.column_concatenate_action, "選択列を隣の列と連結します")
         toolbar.addSeparator()
         
         # 🔧 以下をコメントアウト（メニューに移動済み）
@@ -399,26 +509,29 @@ class Ui_MainWindow(object):
         # add_action_with_tooltip(MainWindow.force_show_action, lambda: "表示がおかしい場合にテーブルを強制表示します（デバッグ用）")
         
     def _create_card_view_container(self, MainWindow):
-        layout = QFormLayout(MainWindow.card_view_container)
+        # ラベル列と値列の2列グリッド（QFormLayoutの折り返し判定を避ける）
+        layout = QGridLayout(MainWindow.card_view_container)
         layout.setContentsMargins(20,20,20,20)
-        
+        layout.setColumnStretch(1, 1)
+        layout.setAlignment(Qt.AlignTop)
+
+    def _create_card_nav_bar(self, MainWindow):
+        """カードビュー上部のレコード移動ボタン（スクロール対象外）"""
         nav_button_layout = QHBoxLayout()
+        nav_button_layout.setContentsMargins(20, 10, 20, 6) # カードページのレイアウト間隔は0なので下側の余白をここで取る
         MainWindow.prev_record_button = QPushButton("前のレコード (Ctrl+←)")
         MainWindow.next_record_button = QPushButton("次のレコード (Ctrl+→)")
         nav_button_layout.addStretch()
         nav_button_layout.addWidget(MainWindow.prev_record_button)
         nav_button_layout.addWidget(MainWindow.next_record_button)
         nav_button_layout.addStretch()
-        
-        layout.addRow(nav_button_layout)
+        return nav_button_layout
 
     def _create_status_bar(self, MainWindow):
         MainWindow.status_label = QLabel("ファイルを開いてください。")
         MainWindow.statusBar().addWidget(MainWindow.status_label, 1)
+        # 操作メッセージ用ラベルは最初のメッセージ表示時にステータスバーへ追加する（show_operation_status）
         MainWindow.operation_label = QLabel("")
-        MainWindow.statusBar().addPermanentWidget(MainWindow.operation_label)
-        MainWindow.hint_label = QLabel("")
-        MainWindow.statusBar().addPermanentWidget(MainWindow.hint_label)
         MainWindow.progress_bar = QProgressBar(MainWindow)
         MainWindow.progress_bar.setMaximumWidth(120)
         MainWindow.progress_bar.hide()
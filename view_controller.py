@@ -1,16 +1,42 @@
 # view_controller.py (提案1のみ反映版)
 
 import os
+import time
 from PySide6.QtWidgets import (
-    QMessageBox, QFormLayout, QLabel, QPlainTextEdit, QSizePolicy, 
+    QMessageBox, QGridLayout, QLabel, QPlainTextEdit, QSizePolicy, 
     QApplication, QDataWidgetMapper, QAbstractItemView, QStyle 
 )
-from PySide6.QtCore import QObject, Signal, Qt, QTimer, QModelIndex, QEvent 
+from PySide6.QtCore import QObject, Signal, Slot, Qt, QTimer, QModelIndex, QEvent 
 import re # 追加: ContentAnalyzerでreを使用
 from collections import Counter # 追加: ContentAnalyzerでCounterを使用
-
-# TooltipEventFilterクラスを完全に削除（13-25行目を削除）
-# ※dialogs.pyに既に存在するため、ここでは削除します。
+from functools import lru_cache
+from ui_main_window import Ui_MainWindow
+
+# デバッグ出力の有無（起動時に1回だけ環境変数を読む。ビュー切り替えやレコード移動のたびには出力しない）
+_DEBUG = os.environ.get('CSV_EDITOR_DEBUG', '0') == '1'
+
+# ステータスバーのヒント（hint_type → 表示文字列）。該当しない場合はファイル情報を表示する
+_CONTEXT_HINTS = {
+    'column_selected': "ヒント: 列ヘッダーを右クリックして列の操作、Ctrl+Shift+Cで列コピーができます。",
+    'row_selected': "ヒント: 選択行を右クリックして行削除、Ctrl+Cで行コピーができます。",
+    'cell_selected': "ヒント: Ctrl+Cでコピー、Ctrl+Xで切り取り、Deleteでクリアができます。",
+    'editing': "編集中: Enterで次のセルへ、Shift+Enterで上のセルへ移動します。",
+}
+
+# これより短く、タグ・URL・拡張子・改行を含まないコンテンツは分析せずに短いテキストとして扱う
+TRIVIAL_CONTENT_MAX_CHARS = 32
+# コンテンツ分析結果のキャッシュ件数（カードビューで同じレコードを行き来するときに再利用する）
+ANALYSIS_CACHE_SIZE = 512
+# これより長いコンテンツ（大きなHTMLなど）はキャッシュに保持しない
+ANALYSIS_CACHE_MAX_CHARS = 4096
+
+# ビュー切り替えエラーをステータスバーに表示する最短間隔（秒）
+TOGGLE_ERROR_STATUS_INTERVAL_SEC = 0.5
+
+# カードビューで一度に生成するフィールド数（残りはスクロールに応じて生成）
+CARD_FIELD_BATCH_SIZE = 30
+# カードフィールドの入力が止まってから高さ調整とモデル更新を行うまでの待ち時間（ミリ秒）
+CARD_EDIT_IDLE_DELAY_MS = 50
 
 class ContentAnalyzer:
     """実際のコンテンツを詳細に分析してサイズを決定"""
@@ -19,6 +45,11 @@ class ContentAnalyzer:
     SIMPLE_TAGS = {'br', 'b', 'i', 'u', 'strong', 'em', 'span'}
     COMPLEX_TAGS = {'table', 'div', 'ul', 'ol', 'dl', 'form'}
     MEDIA_TAGS = {'img', 'video', 'iframe', 'object', 'embed'}
+
+    # 分析で使う正規表現（クラス定義時に1回だけコンパイル）
+    _TAG_RE = re.compile(r'<([^>/\s]+)[\s>]')
+    _URL_RE = re.compile(r'https?://[^\s<>"]+')
+    _IMG_URL_RE = re.compile(r'\.(jpg|jpeg|png|gif|webp|svg)["\s>]', re.I)
     
     @classmethod
     def analyze_content(cls, content: str, column_name: str = "") -> dict:
@@ -32,7 +63,36 @@ class ContentAnalyzer:
             }
         
         content_str = str(content).strip()
-        
+
+        # 短い単純なテキスト（ID・コード・数値など）は正規表現を使わずに結果を返す
+        if (len(content_str) < TRIVIAL_CONTENT_MAX_CHARS and 'http' not in content_str
+                and not any(c in content_str for c in '<.\n')):
+            return {
+                'type': 'text_short',
+                'complexity': 0,
+                'suggested_rows': (1, 3),
+                'priority': 'low',
+                'metrics': {'chars': len(content_str), 'lines': 0, 'images': 0, 'tables': 0, 'urls': 0}
+            }
+
+        if len(content_str) <= ANALYSIS_CACHE_MAX_CHARS:
+            return cls._analyze_text_cached(content_str)
+        return cls._analyze_text(content_str)
+
+    @classmethod
+    @lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+    def _analyze_text_cached(cls, content_str: str) -> dict:
+        """_analyze_textのキャッシュ付き版（戻り値は変更しないこと）"""
+        return cls._analyze_text(content_str)
+
+    @classmethod
+    def clear_cache(cls):
+        """分析結果のキャッシュを破棄"""
+        cls._analyze_text_cached.cache_clear()
+
+    @classmethod
+    def _analyze_text(cls, content_str: str) -> dict:
+        """空でないコンテンツの分析"""
         # 基本メトリクス
         char_count = len(content_str)
         line_breaks = content_str.count('\n') + content_str.count('<br')
@@ -41,11 +101,11 @@ class ContentAnalyzer:
         tag_analysis = cls._analyze_html_tags(content_str)
         
         # URL検出
-        url_count = len(re.findall(r'https?://[^\s<>"]+', content_str))
+        url_count = len(cls._URL_RE.findall(content_str)) if 'http' in content_str else 0
         
         # 画像検出（imgタグ + 画像URL）
         img_count = tag_analysis['media_tags'].get('img', 0)
-        img_url_count = len(re.findall(r'\.(jpg|jpeg|png|gif|webp|svg)["\s>]', content_str, re.I))
+        img_url_count = len(cls._IMG_URL_RE.findall(content_str)) if '.' in content_str else 0
         total_images = img_count + img_url_count
         
         # コンテンツタイプの判定
@@ -75,8 +135,19 @@ class ContentAnalyzer:
     @classmethod
     def _analyze_html_tags(cls, content: str) -> dict:
         """HTMLタグの詳細分析"""
+        # タグがない場合は小文字化のコピーと正規表現を省く
+        if '<' not in content:
+            return {
+                'total_tags': 0,
+                'unique_tags': 0,
+                'simple_tags': {},
+                'complex_tags': {},
+                'media_tags': {},
+                'complexity': 0
+            }
+
         # すべてのHTMLタグを抽出
-        all_tags = re.findall(r'<([^>/\s]+)[\s>]', content.lower())
+        all_tags = cls._TAG_RE.findall(content.lower())
         tag_counter = Counter(all_tags)
         
         # タグを分類
@@ -196,12 +267,24 @@ class ViewController(QObject):
         self.main_window = main_window # CsvEditorAppQtのインスタンス
         self.current_view = 'table' # 初期ビューはテーブル
         self.card_fields_widgets = {} # カードビューのフィールドウィジェットを保持
+        self._modified_card_docs = set() # 編集フラグが立っているフィールドのドキュメント
+        self._card_field_pool = [] # 生成済みの (ラベル, フィールド, 入力停止タイマー)。列順に並び、ファイルを変えても使い回す
+        self._last_toggle_error_time = 0.0 # 最後にビュー切り替えエラーを表示した時刻（time.monotonic）
+        self._screen_height = None # 高さ調整で使う画面の高さ（プライマリ画面が変わるまでキャッシュ）
+        QApplication.instance().primaryScreenChanged.connect(self._on_primary_screen_changed)
+        self._pending_card_columns = [] # まだウィジェットを生成していない (列番号, 列名)
+
+        # カードビューは表示範囲に近づいたフィールドだけを生成する
+        card_scroll_bar = self.main_window.card_scroll_area.verticalScrollBar()
+        card_scroll_bar.valueChanged.connect(self._on_card_scrolled)
+        card_scroll_bar.rangeChanged.connect(lambda _min, _max: self._on_card_scrolled(card_scroll_bar.value()))
         
     def show_welcome_screen(self):
         """ウェルカム画面を表示"""
-        print("DEBUG: ViewController.show_welcome_screen called")
-        self.main_window.view_stack.hide()
-        self.main_window.welcome_widget.show()
+        if _DEBUG: print("DEBUG: ViewController.show_welcome_screen called")
+        self.main_window.ensure_welcome_widget()
+        self.main_window.view_stack.setCurrentWidget(self.main_window.welcome_widget)
+        self.main_window.view_stack.show()
         self.main_window._set_ui_state('welcome')
         self.main_window.status_label.setText("ファイルを開いてください。")
         self.main_window.view_toggle_action.setEnabled(False)
@@ -210,43 +293,38 @@ class ViewController(QObject):
     
     def show_main_view(self):
         """メインビュー（テーブルまたはカード）を表示"""
-        print("DEBUG: ViewController.show_main_view called")
+        if _DEBUG: print("DEBUG: ViewController.show_main_view called")
         
-        # ウェルカム画面を非表示
-        self.main_window.welcome_widget.hide()
-        
-        # view_stackを表示
+        # view_stackを表示（ウェルカム画面は以下のページ切り替えで隠れる）
         self.main_window.view_stack.show()
         
         # 現在のビュー状態に応じて表示を切り替える
         if self.current_view == 'table':
-            print("DEBUG: テーブルビューを表示")
-            self.main_window.table_view.show()
-            self.main_window.card_scroll_area.hide()
-            self.main_window.view_toggle_action.setText("カードビュー")
-            self.main_window.view_toggle_action.setIcon(
-                self.main_window.style().standardIcon(QStyle.SP_FileDialogDetailedView)
-            )
+            if _DEBUG: print("DEBUG: テーブルビューを表示")
+            self.main_window.view_stack.setCurrentWidget(self.main_window.table_view)
+            self._set_view_toggle_action("カードビュー", QStyle.SP_FileDialogDetailedView)
         else: # self.current_view == 'card'
-            print("DEBUG: カードビューを表示")
-            self.main_window.table_view.hide()
-            self.main_window.card_scroll_area.show()
-            self.main_window.view_toggle_action.setText("テーブルビュー")
+            if _DEBUG: print("DEBUG: カードビューを表示")
+            self.main_window.view_stack.setCurrentWidget(self.main_window.card_page)
             # 🔥 修正: SP_FileDialogListView は存在しないため SP_FileDialogContentsView に変更
-            self.main_window.view_toggle_action.setIcon(
-                self.main_window.style().standardIcon(QStyle.SP_FileDialogContentsView)
-            )
+            self._set_view_toggle_action("テーブルビュー", QStyle.SP_FileDialogContentsView)
         
         self.main_window._set_ui_state('normal') # main_windowのUI状態を設定
         self.main_window.view_toggle_action.setEnabled(True)
         
-        # ビューの更新を強制
-        self.main_window.table_view.viewport().update()
-        QApplication.processEvents()
+        # テーブル表示時だけ再描画を予約（描画は次のイベントループで行われる）
+        if self.current_view == 'table':
+            self.main_window.table_view.viewport().update()
         
-        print(f"DEBUG: view_stack.isVisible() = {self.main_window.view_stack.isVisible()}")
-        print(f"DEBUG: table_view.isVisible() = {self.main_window.table_view.isVisible()}")
+        if _DEBUG: print(f"DEBUG: view_stack.isVisible() = {self.main_window.view_stack.isVisible()}")
+        if _DEBUG: print(f"DEBUG: table_view.isVisible() = {self.main_window.table_view.isVisible()}")
     
+    def _set_view_toggle_action(self, text, standard_pixmap):
+        """ビュー切り替えアクションの表示を切り替え先に合わせる（アイコンは共有キャッシュから取得）"""
+        self.main_window.view_toggle_action.setText(text)
+        self.main_window.view_toggle_action.setIcon(
+            Ui_MainWindow.standard_icon(self.main_window.style(), standard_pixmap))
+
     def toggle_view(self):
         """テーブルビューとカードビューを切り替える（安全版）"""
         if self.main_window.table_model.rowCount() == 0:
@@ -265,48 +343,28 @@ class ViewController(QObject):
                         "カードビューで表示する行を選択してください。")
                     return
 
-                print("DEBUG: テーブルビュー → カードビューへ切り替え")
+                if _DEBUG: print("DEBUG: テーブルビュー → カードビューへ切り替え")
+                # 先にページを切り替え、表示された状態でフィールドの高さを調整する
+                self.main_window.view_stack.setCurrentWidget(self.main_window.card_page)
                 self._show_card_view(current_index.row())
-                self.main_window.table_view.hide()
-                self.main_window.card_scroll_area.show()
-                self.main_window.view_toggle_action.setText("テーブルビュー")
-                self.main_window.view_toggle_action.setIcon(
-                    self.main_window.style().standardIcon(QStyle.SP_FileDialogContentsView)
-                )
+                self._set_view_toggle_action("テーブルビュー", QStyle.SP_FileDialogContentsView)
                 self.current_view = 'card'
-                print("DEBUG: カードビューへの切り替え完了")
+                if _DEBUG: print("DEBUG: カードビューへの切り替え完了")
 
             else:  # self.current_view == 'card'
                 # カードビュー → テーブルビュー
-                print("DEBUG: カードビュー → テーブルビューへ切り替え")
+                if _DEBUG: print("DEBUG: カードビュー → テーブルビューへ切り替え")
                 
-                # 🔥 重要：編集フラグチェックによる安全な保存
-                has_edits = False
+                # 🔥 重要：編集フラグチェックによる安全な保存（編集がある場合のみsubmit）
                 if hasattr(self.main_window, 'card_mapper'):
-                    # 各フィールドの編集状態をチェック
-                    for widget in self.card_fields_widgets.values():
-                        if hasattr(widget, 'document') and widget.document().isModified():
-                            has_edits = True
-                            break
-                    
-                    # 編集がある場合のみsubmit
-                    if has_edits:
-                        print("DEBUG: 編集内容を検出、保存を実行")
-                        self.main_window.card_mapper.submit()
-                        # 編集フラグをリセット
-                        for widget in self.card_fields_widgets.values():
-                            if hasattr(widget, 'document'):
-                                widget.document().setModified(False)
+                    if self.submit_card_edits():
+                        if _DEBUG: print("DEBUG: 編集内容を検出、保存を実行")
                     else:
-                        print("DEBUG: 編集なし、submitをスキップ")
+                        if _DEBUG: print("DEBUG: 編集なし、submitをスキップ")
 
                 # ビューを切り替え
-                self.main_window.card_scroll_area.hide()
-                self.main_window.table_view.show()
-                self.main_window.view_toggle_action.setText("カードビュー")
-                self.main_window.view_toggle_action.setIcon(
-                    self.main_window.style().standardIcon(QStyle.SP_FileDialogDetailedView)
-                )
+                self.main_window.view_stack.setCurrentWidget(self.main_window.table_view)
+                self._set_view_toggle_action("カードビュー", QStyle.SP_FileDialogDetailedView)
                 self.current_view = 'table'
 
                 # テーブルビューの現在位置を同期
@@ -317,38 +375,47 @@ class ViewController(QObject):
                         self.main_window.table_view.setCurrentIndex(table_index)
                         self.main_window.table_view.scrollTo(table_index, QAbstractItemView.PositionAtCenter)
 
-                print("DEBUG: テーブルビューへの切り替え完了")
+                if _DEBUG: print("DEBUG: テーブルビューへの切り替え完了")
 
-            # モデルとビューの更新
-            self.main_window.table_view.viewport().update()
+            # テーブルに戻ったときだけ再描画する（カードビュー表示中のテーブルは隠れている）
+            if self.current_view == 'table':
+                self.main_window.table_view.viewport().update()
             self.view_changed.emit(self.current_view)
 
         except Exception as e:
             print(f"ERROR: ビュー切り替え中にエラーが発生: {e}")
-            import traceback
-            traceback.print_exc()
-            self.main_window.show_operation_status(f"ビュー切り替えエラー: {e}", is_error=True)
+            if _DEBUG:
+                import traceback
+                traceback.print_exc()
+            # 切り替えボタンの連打で同じエラーが続く場合、ステータス表示は一定間隔ごとにまとめる
+            now = time.monotonic()
+            if now - self._last_toggle_error_time >= TOGGLE_ERROR_STATUS_INTERVAL_SEC:
+                self._last_toggle_error_time = now
+                self.main_window.show_operation_status(f"ビュー切り替えエラー: {e}", is_error=True)
 
     def recreate_card_view_fields(self):
         """カードビューのフィールドを再作成（完全安全版）"""
-        print("DEBUG: recreate_card_view_fields called")
+        if _DEBUG: print("DEBUG: recreate_card_view_fields called")
+
+        # 以前のデータの分析結果を保持し続けないよう、キャッシュを破棄する
+        ContentAnalyzer.clear_cache()
 
         layout = self.main_window.card_view_container.layout()
         
         # レイアウトの確認と再作成
-        if not isinstance(layout, QFormLayout):
-            print("警告: card_view_containerのレイアウトがQFormLayoutではありません。再作成します。")
+        if not isinstance(layout, QGridLayout):
+            print("警告: card_view_containerのレイアウトがQGridLayoutではありません。再作成します。")
             if layout is not None:
                 while layout.count():
                     item = layout.takeAt(0)
                     if item.widget():
                         item.widget().deleteLater()
-            layout = QFormLayout()
+            layout = QGridLayout()
+            layout.setColumnStretch(1, 1)
+            layout.setAlignment(Qt.AlignTop)
             self.main_window.card_view_container.setLayout(layout)
-
-        # ナビゲーションボタン以外のフィールドを削除
-        while layout.rowCount() > 1:
-            layout.removeRow(1)
+            self._card_field_pool.clear()
+            self._modified_card_docs.clear()
 
         # 🔥 重要：マッピングクリア時にsubmitを防ぐ
         if hasattr(self.main_window, 'card_mapper'):
@@ -357,58 +424,49 @@ class ViewController(QObject):
             self.main_window.card_mapper.clearMapping()
 
         self.card_fields_widgets.clear()
+        header = list(getattr(self.main_window, 'header', None) or [])
+
+        # 既存のフィールドは同じ位置の列に使い回し、新しい列数を超える分だけ削除する（ナビゲーションボタンはレイアウト外）
+        for label, field_widget, _idle_timer in self._card_field_pool[len(header):]:
+            self._modified_card_docs.discard(field_widget.document())
+            layout.removeWidget(label)
+            layout.removeWidget(field_widget)
+            label.deleteLater()
+            field_widget.deleteLater()
+        del self._card_field_pool[len(header):]
 
         # ヘッダーが存在しない場合は終了
-        if not hasattr(self.main_window, 'header') or not self.main_window.header:
+        if not header:
             print("WARNING: ヘッダーが定義されていません")
             return
 
-        # 新しいフィールドを作成
-        for col_idx, col_name in enumerate(self.main_window.header):
-            label = QLabel(f"{col_name}:")
-            
-            field_widget = QPlainTextEdit()
-            field_widget.setProperty("column_name", col_name)
-            field_widget.setLineWrapMode(QPlainTextEdit.WidgetWidth)
-            field_widget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-            field_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-
-            # スタイル設定
-            theme = self.main_window.theme
-            field_widget.setStyleSheet(f"""
-                QPlainTextEdit {{
-                    background-color: {theme.BG_LEVEL_0};
-                    color: {theme.TEXT_PRIMARY};
-                    border: 1px solid {theme.BG_LEVEL_3};
-                    padding: 4px;
-                    font-family: "Consolas", "Monaco", monospace;
-                }}
-            """)
-
-            # 初期サイズ設定
-            field_widget.setMinimumHeight(30)
-            field_widget.setMaximumHeight(100)
-
-            # 高さ調整の接続
-            field_widget.document().contentsChanged.connect(
-                lambda f=field_widget: self._adjust_text_edit_height(f)
-            )
-            
-            # 🔥 新機能：直接的なモデル更新
-            field_widget.textChanged.connect(
-                lambda fw=field_widget, c=col_idx: self._on_card_field_changed(fw, c)
-            )
-
-            self.card_fields_widgets[col_name] = field_widget
-            layout.addRow(label, field_widget)
-
-            # マッピング追加
-            self.main_window.card_mapper.addMapping(field_widget, col_idx, b'plainText')
-            
-            # イベントフィルター設定
-            field_widget.installEventFilter(self)
-
-        # カードマッパーの設定
+        for (label, field_widget, idle_timer), (col_idx, col_name) in zip(self._card_field_pool, enumerate(header)):
+            # 前のファイルの内容を消す（空の内容をモデルへ書き戻さないよう、クリアで動いたタイマーも止める）
+            field_widget.blockSignals(True)
+            field_widget.clear()
+            field_widget.document().setModified(False)
+            field_widget.blockSignals(False)
+            idle_timer.stop()
+            self._bind_card_field(label, field_widget, col_idx, col_name)
+
+        # フィールドのスタイルはコンテナに1回だけ設定し、全フィールドで共有する
+        theme = self.main_window.theme
+        self.main_window.card_view_container.setStyleSheet(f"""
+            QPlainTextEdit {{
+                background-color: {theme.BG_LEVEL_0};
+                color: {theme.TEXT_PRIMARY};
+                border: 1px solid {theme.BG_LEVEL_3};
+                padding: 4px;
+                font-family: "Consolas", "Monaco", monospace;
+            }}
+        """)
+
+        # 新しいフィールドを作成（最初の一部のみ。残りはスクロールに応じて生成）
+        self._pending_card_columns = list(enumerate(header))[len(self._card_field_pool):]
+        self._materialize_card_fields()
+
+        # カードマッパーの設定（同じモデルなので何もしない。setModel(None) で外すとマッピングと
+        # 現在行が消えるため外さない。addMapping は値を入れないので、表示は _show_card_view で行う）
         self.main_window.card_mapper.setModel(self.main_window.table_model)
         
         # 🔥 重要：ManualSubmitポリシーで固定
@@ -421,11 +479,81 @@ class ViewController(QObject):
             if self.main_window.table_model.rowCount() > 0:
                 self._show_card_view(row_to_show)
 
-        print(f"DEBUG: カードビューフィールド作成完了: {len(self.card_fields_widgets)}個のフィールド")
+        if _DEBUG: print(f"DEBUG: カードビューフィールド作成完了: {len(self.card_fields_widgets)}個のフィールド")
+
+    def _materialize_card_fields(self, count=CARD_FIELD_BATCH_SIZE):
+        """未生成のカードフィールドを先頭から指定数だけ生成する"""
+        if not self._pending_card_columns:
+            return
+        container = self.main_window.card_view_container
+        layout = container.layout()
+        batch = self._pending_card_columns[:count]
+        del self._pending_card_columns[:count]
+        # 追加のたびに再描画させず、バッチ全体を追加してから1回だけ描画する
+        container.setUpdatesEnabled(False)
+        try:
+            for col_idx, col_name in batch:
+                self._create_card_field(layout, col_idx, col_name)
+        finally:
+            container.setUpdatesEnabled(True)
+
+    def _on_card_scrolled(self, value):
+        """スクロール位置が未生成フィールドに近づいたら次のフィールドを生成する"""
+        if not self._pending_card_columns:
+            return
+        scroll_area = self.main_window.card_scroll_area
+        if scroll_area.verticalScrollBar().maximum() - value < scroll_area.viewport().height():
+            self._materialize_card_fields()
+            # addMapping は対応付けるだけで値を入れないので、編集内容を保存してから現在のレコードを読み直す
+            self.submit_card_edits()
+            self.main_window.card_mapper.revert()
+            self._adjust_all_card_field_heights()
+
+    def _create_card_field(self, layout, col_idx, col_name):
+        """カードビューのフィールドを1つ作成し、マッピングする"""
+        label = QLabel()
+        
+        field_widget = QPlainTextEdit()
+        field_widget.setLineWrapMode(QPlainTextEdit.WidgetWidth)
+        field_widget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        field_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+
+        # 初期サイズ設定
+        field_widget.setMinimumHeight(30)
+        field_widget.setMaximumHeight(100)
+
+        # 連続入力中はまとめて、入力が止まってから1回だけ高さ調整とモデル更新を行う
+        idle_timer = QTimer(field_widget)
+        idle_timer.setSingleShot(True)
+        idle_timer.setInterval(CARD_EDIT_IDLE_DELAY_MS)
+        # 🔥 新機能：直接的なモデル更新（列番号はプール内の位置と同じなので使い回しても変わらない）
+        idle_timer.timeout.connect(
+            lambda fw=field_widget, c=col_idx: self._on_card_field_idle(fw, c)
+        )
+        field_widget.document().contentsChanged.connect(idle_timer.start)
+        field_widget.document().modificationChanged.connect(
+            lambda modified, d=field_widget.document(): self._on_card_document_modified(d, modified)
+        )
+
+        # フィールドは列順に生成されるので、列番号をそのままグリッドの行番号に使う
+        layout.addWidget(label, col_idx, 0, Qt.AlignTop)
+        layout.addWidget(field_widget, col_idx, 1)
+        self._card_field_pool.append((label, field_widget, idle_timer))
+        self._bind_card_field(label, field_widget, col_idx, col_name)
+        
+        # イベントフィルター設定
+        field_widget.installEventFilter(self)
+
+    def _bind_card_field(self, label, field_widget, col_idx, col_name):
+        """フィールドに列名を設定し、マッピングする"""
+        label.setText(f"{col_name}:")
+        field_widget.setProperty("column_name", col_name)
+        self.card_fields_widgets[col_name] = field_widget
+        self.main_window.card_mapper.addMapping(field_widget, col_idx, b'plainText')
 
     def _show_card_view(self, row_idx_in_model):
         """カードビューを表示（安全版）"""
-        print(f"DEBUG: _show_card_view called with row {row_idx_in_model}")
+        if _DEBUG: print(f"DEBUG: _show_card_view called with row {row_idx_in_model}")
 
         if not self.main_window.table_model.rowCount():
             self.main_window.show_operation_status("表示するデータがありません。", 3000, is_error=True)
@@ -442,33 +570,49 @@ class ViewController(QObject):
         # 🔥 安全な行変更
         if hasattr(self.main_window, 'card_mapper'):
             # 現在の編集内容を保存（必要な場合のみ）
-            has_edits = any(widget.document().isModified()
-                           for widget in self.card_fields_widgets.values()
-                           if hasattr(widget, 'document'))
-            
-            if has_edits:
-                print("DEBUG: 行変更前に編集内容を保存")
-                self.main_window.card_mapper.submit()
-                # 編集フラグをリセット
-                for widget in self.card_fields_widgets.values():
-                    if hasattr(widget, 'document'):
-                        widget.document().setModified(False)
+            if self.submit_card_edits():
+                if _DEBUG: print("DEBUG: 行変更前に編集内容を保存")
 
             # 新しい行に移動
             self.main_window.card_mapper.setCurrentIndex(model_index.row())
 
             # フィールドの高さを調整
-            for field_widget in self.card_fields_widgets.values():
-                self._adjust_text_edit_height(field_widget)
+            self._adjust_all_card_field_heights()
 
         # フォーカス設定
         self.main_window.card_scroll_area.setFocus()
         
         if self.card_fields_widgets:
             first_widget = next(iter(self.card_fields_widgets.values()))
-            QTimer.singleShot(50, lambda: first_widget.setFocus())
+            # 次のイベントループで設定（フィールドが先に削除された場合は呼ばれない）
+            QTimer.singleShot(0, first_widget.setFocus)
+
+        if _DEBUG: print(f"DEBUG: カードビュー表示完了: 行 {model_index.row()}")
+
+    def _on_card_field_idle(self, field_widget: QPlainTextEdit, col_idx: int):
+        """入力が止まったフィールドの高さ調整とモデル更新"""
+        # テーブルビュー表示中はマッパーが内容を入れ替えるだけで、ユーザーの編集はない
+        if not self.main_window.card_scroll_area.isVisible():
+            return
+        self._adjust_text_edit_height(field_widget)
+        self._on_card_field_changed(field_widget, col_idx)
 
-        print(f"DEBUG: カードビュー表示完了: 行 {model_index.row()}")
+    def _on_card_document_modified(self, document, modified):
+        """フィールドの編集フラグの変化を記録する（編集中のドキュメントだけを集合で持つ）"""
+        if modified:
+            self._modified_card_docs.add(document)
+        else:
+            self._modified_card_docs.discard(document)
+
+    def submit_card_edits(self):
+        """編集されたフィールドがあればモデルへ保存して編集フラグを戻す。保存した場合はTrueを返す"""
+        if not self._modified_card_docs:
+            return False
+        self.main_window.card_mapper.submit()
+        # setModified(False) で集合から外れるので、コピーを回す
+        for document in list(self._modified_card_docs):
+            document.setModified(False)
+        return True
 
     def _on_card_field_changed(self, field_widget: QPlainTextEdit, col_idx: int):
         """カードフィールドの内容変更時の直接モデル更新"""
@@ -482,11 +626,26 @@ class ViewController(QObject):
         # 直接モデルを更新（QDataWidgetMapperを経由しない）
         self.main_window.table_model.setData(model_index, new_value, Qt.EditRole)
 
+    def _adjust_all_card_field_heights(self):
+        """全フィールドの高さを調整し、カードビューの再描画は最後に1回だけ行う"""
+        # レコード移動でマッパーが内容を入れ替えたときに動いた入力停止タイマーは、
+        # ここでの一括調整と同じ処理（とモデルへの同値の書き込み）になるので止める
+        for _label, _field_widget, idle_timer in self._card_field_pool:
+            idle_timer.stop()
+        # 隠れている間は調整しない（表示するときに _show_card_view から調整される）
+        if not self.main_window.card_scroll_area.isVisible():
+            return
+        container = self.main_window.card_view_container
+        container.setUpdatesEnabled(False)
+        try:
+            for field_widget in self.card_fields_widgets.values():
+                self._adjust_text_edit_height(field_widget)
+        finally:
+            container.setUpdatesEnabled(True)
+
     def _adjust_text_edit_height(self, text_edit_widget: QPlainTextEdit):
         """コンテンツ分析に基づく動的高さ調整"""
         try:
-            text_edit_widget.setUpdatesEnabled(False)
-            
             # 基本情報の取得
             column_name = text_edit_widget.property("column_name") or ""
             content = text_edit_widget.toPlainText()
@@ -497,7 +656,9 @@ class ViewController(QObject):
             # 画面とレイアウト情報
             density = self.main_window.density
             line_height = density['row_height']
-            screen_height = QApplication.primaryScreen().size().height()
+            if self._screen_height is None:
+                self._screen_height = QApplication.primaryScreen().size().height()
+            screen_height = self._screen_height
             
             # サイズ計算
             min_rows, max_rows = analysis['suggested_rows']
@@ -531,15 +692,18 @@ class ViewController(QObject):
                 if min_height > current_height * 2:
                     min_height = int(current_height * 1.3)
             
-            # サイズ設定
-            text_edit_widget.setMinimumHeight(min_height)
-            text_edit_widget.setMaximumHeight(max_height)
+            # サイズ設定（前回と同じ範囲なら再レイアウト・再描画を起こさない）
+            if min_height != text_edit_widget.minimumHeight() or max_height != text_edit_widget.maximumHeight():
+                text_edit_widget.setUpdatesEnabled(False)
+                text_edit_widget.setMinimumHeight(min_height)
+                text_edit_widget.setMaximumHeight(max_height)
+                text_edit_widget.setUpdatesEnabled(True)
             
             # メタデータ保存（デバッグ用）
             text_edit_widget.setProperty("content_analysis", analysis)
             
             # デバッグ出力（開発時のみ）
-            if os.environ.get('CSV_EDITOR_DEBUG', '0') == '1':
+            if _DEBUG:
                 print(f"Field '{column_name}': Type={analysis['type']}, "
                       f"Size={min_height}-{max_height}px, "
                       f"Metrics={analysis['metrics']}")
@@ -549,10 +713,14 @@ class ViewController(QObject):
             print(f"Height adjustment error for {column_name}: {e}")
             text_edit_widget.setMinimumHeight(50)
             text_edit_widget.setMaximumHeight(200)
-        finally:
             text_edit_widget.setUpdatesEnabled(True)
     
+    def _on_primary_screen_changed(self, screen):
+        """プライマリ画面が変わったら、キャッシュした画面の高さを次回の高さ調整で取り直す"""
+        self._screen_height = None
+
     # 修正1: 未実装メソッドの追加
+    @Slot()
     def go_to_prev_record(self):
         """前のレコードへ移動"""
         current_row = self.main_window.card_mapper.currentIndex()
@@ -560,6 +728,7 @@ class ViewController(QObject):
         self._move_card_record(new_row)
     
     # 修正1: 未実装メソッドの追加 (go_to_next_recordは既存だが、完全なガイドに従い再度記載)
+    @Slot()
     def go_to_next_record(self): 
         """次のレコードへ移動""" 
         current_row = self.main_window.card_mapper.currentIndex() 
@@ -568,38 +737,26 @@ class ViewController(QObject):
     
     def _move_card_record(self, new_row: int):
         """カードビューのレコード移動ロジック（安全版）"""
-        if 0 <= new_row < self.main_window.table_model.rowCount():
+        table_model = self.main_window.table_model
+        row_count = table_model.rowCount()
+        if 0 <= new_row < row_count:
             # 編集内容の保存（必要な場合のみ）
-            has_edits = any(widget.document().isModified()
-                           for widget in self.card_fields_widgets.values()
-                           if hasattr(widget, 'document'))
-            
-            if has_edits and hasattr(self.main_window, 'card_mapper'):
-                print("DEBUG: レコード移動前に編集内容を保存")
-                self.main_window.card_mapper.submit()
-                # 編集フラグをリセット
-                for widget in self.card_fields_widgets.values():
-                    if hasattr(widget, 'document'):
-                        widget.document().setModified(False)
+            if hasattr(self.main_window, 'card_mapper') and self.submit_card_edits():
+                if _DEBUG: print("DEBUG: レコード移動前に編集内容を保存")
 
             # 新しいレコードに移動
             self.main_window.card_mapper.setCurrentIndex(new_row)
 
             # フィールドの高さを再調整
-            for field_widget in self.card_fields_widgets.values():
-                self._adjust_text_edit_height(field_widget)
-
-            # テーブルビューも同期
-            self.main_window.table_view.setCurrentIndex(
-                self.main_window.table_model.index(new_row, 0)
-            )
-            self.main_window.table_view.scrollTo(
-                self.main_window.table_model.index(new_row, 0),
-                QAbstractItemView.PositionAtCenter
-            )
-            self.main_window.show_operation_status(
-                f"レコード {new_row + 1}/{self.main_window.table_model.rowCount()}"
-            )
+            self._adjust_all_card_field_heights()
+
+            # テーブルビューも同期（カードビュー表示中はテーブルが隠れているので、
+            # スクロールはテーブルビューへ戻るときに toggle_view でまとめて行う）
+            table_index = table_model.index(new_row, 0)
+            self.main_window.table_view.setCurrentIndex(table_index)
+            if self.current_view != 'card':
+                self.main_window.table_view.scrollTo(table_index, QAbstractItemView.PositionAtCenter)
+            self.main_window.show_operation_status(f"レコード {new_row + 1}/{row_count}")
         else:
             self.main_window.show_operation_status("これ以上レコードはありません。", 2000)
     
@@ -618,15 +775,15 @@ class ViewController(QObject):
             if event.type() == QEvent.KeyPress:
                 if event.modifiers() & Qt.ControlModifier:
                     if event.key() == Qt.Key_Left:
-                        print("DEBUG: Ctrl+Left pressed in card view")
+                        if _DEBUG: print("DEBUG: Ctrl+Left pressed in card view")
                         self.go_to_prev_record()
                         return True  # イベントを消費
                     elif event.key() == Qt.Key_Right:
-                        print("DEBUG: Ctrl+Right pressed in card view")
+                        if _DEBUG: print("DEBUG: Ctrl+Right pressed in card view")
                         self.go_to_next_record()
                         return True
                     elif event.key() == Qt.Key_Up:
-                        print("DEBUG: Ctrl+Up pressed in card view")
+                        if _DEBUG: print("DEBUG: Ctrl+Up pressed in card view")
                         current_row = self.main_window.card_mapper.currentIndex()
                         if current_row > 0:
                             self._move_card_record(current_row - 1)
@@ -634,7 +791,7 @@ class ViewController(QObject):
                             self.main_window.show_operation_status("最初のレコードです。", 2000)
                         return True
                     elif event.key() == Qt.Key_Down:
-                        print("DEBUG: Ctrl+Down pressed in card view")
+                        if _DEBUG: print("DEBUG: Ctrl+Down pressed in card view")
                         current_row = self.main_window.card_mapper.currentIndex()
                         if current_row < self.main_window.table_model.rowCount() - 1:
                             self._move_card_record(current_row + 1)
@@ -646,15 +803,8 @@ class ViewController(QObject):
 
     def show_context_hint(self, hint_type=''):
         """ステータスバーにヒントを表示"""
-        if hint_type == 'column_selected':
-            hint = "ヒント: 列ヘッダーを右クリックして列の操作、Ctrl+Shift+Cで列コピーができます。"
-        elif hint_type == 'row_selected':
-            hint = "ヒント: 選択行を右クリックして行削除、Ctrl+Cで行コピーができます。"
-        elif hint_type == 'cell_selected':
-            hint = "ヒント: Ctrl+Cでコピー、Ctrl+Xで切り取り、Deleteでクリアができます。"
-        elif hint_type == 'editing':
-            hint = "編集中: Enterで次のセルへ、Shift+Enterで上のセルへ移動します。"
-        else:
+        hint = _CONTEXT_HINTS.get(hint_type)
+        if hint is None:
             if self.main_window.filepath:
                 total_rows = self.main_window.table_model.rowCount()
                 total_cols = self.main_window.table_model.columnCount()